@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class BirthdayRecord:
+    """생일자 한 명의 정보 (슬롯 기반의 가벼운 레코드, slots=True는 Python 3.10 이상 필요)"""
+    name: str
+    gender: str
+    birth_date: date
+    age: int
+    # 필수 컬럼 외에 템플릿에서 쓰는 명단 컬럼 값: ((컬럼 이름, 값), ...)
+    extra: Tuple[Tuple[str, str], ...] = ()
+
+    @property
+    def month(self) -> int:
+        return self.birth_date.month
+
+    @property
+    def day(self) -> int:
+        return self.birth_date.day
@@ -0,0 +1,81 @@
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, Optional
+
+from birthday_record import BirthdayRecord
+
+# 저장 위치마다 하나씩 두는 생성 기록 파일
+MANIFEST_NAME = '.birthday_ppt_manifest.json'
+
+# 슬라이드 생성 방식이 바뀌어 같은 입력이라도 결과가 달라지면 올림 (이전 PPT를 다시 생성)
+DECK_FORMAT_VERSION = '2'
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """파일 내용의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def deck_digest(birthday_list: Iterable[BirthdayRecord], month: int,
+                template_digest: str, font_name: str, people_per_slide: int = 1) -> str:
+    """PPT 한 개의 입력 해시 (생일자 데이터와 추가 컬럼 + 월 + 템플릿 + 폰트 + 슬라이드당 인원)"""
+    digest = hashlib.sha256()
+    digest.update(
+        f"{DECK_FORMAT_VERSION}\n{template_digest}\n{font_name}\n{people_per_slide}\n{month}\n".encode('utf-8')
+    )
+    for person in birthday_list:
+        extra = ''.join(f"\t{column}={value}" for column, value in person.extra)
+        digest.update(
+            f"{person.name}\t{person.gender}\t{person.birth_date.isoformat()}\t{person.age}{extra}\n".encode('utf-8')
+        )
+    return digest.hexdigest()
+
+
+class DeckManifest:
+    """저장 위치에 생성된 PPT와 그 입력 해시를 기록해 바뀌지 않은 PPT는 다시 만들지 않게 함"""
+
+    def __init__(self, save_path: str):
+        self.path = os.path.join(save_path, MANIFEST_NAME)
+        self.save_path = save_path
+        self.entries: Dict[str, Dict] = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            # 기록이 없거나 손상되었으면 모두 새로 생성
+            self.entries = {}
+
+    def is_fresh(self, file_name: str, digest: str) -> bool:
+        """같은 입력으로 만든 PPT가 그대로 남아 있는지 확인 (사용자가 수정한 파일은 다시 생성)"""
+        entry = self.entries.get(file_name)
+        if entry is None or entry.get('digest') != digest:
+            return False
+        stat = self._stat(file_name)
+        return stat is not None and stat == (entry.get('size'), entry.get('mtime_ns'))
+
+    def update(self, file_name: str, digest: str) -> None:
+        stat = self._stat(file_name)
+        if stat is None:
+            self.entries.pop(file_name, None)
+            return
+        self.entries[file_name] = {'digest': digest, 'size': stat[0], 'mtime_ns': stat[1]}
+
+    def save(self) -> None:
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        except OSError:
+            # 기록을 남기지 못해도 다음 실행에서 다시 생성될 뿐이므로 무시
+            pass
+
+    def _stat(self, file_name: str) -> Optional[tuple]:
+        try:
+            stat = os.stat(os.path.join(self.save_path, file_name))
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
@@ -0,0 +1,141 @@
+import argparse
+import logging
+import os
+import sys
+from typing import List, Optional
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='생일자 엑셀 명단으로 월별 생일 PPT를 생성합니다 (GUI 없이 실행).'
+    )
+    parser.add_argument('inputs', nargs='+', help='생일자 엑셀 파일, 폴더 또는 glob 패턴 (여러 개 지정 가능)')
+    parser.add_argument('-o', '--output-dir', default='.', help='PPT 저장 위치 (기본값: 현재 폴더)')
+    parser.add_argument('--font', default='Pretendard', help='슬라이드에 적용할 폰트 (기본값: Pretendard)')
+    parser.add_argument('--month', type=int, action='append', choices=range(1, 13), metavar='MONTH',
+                        help='생성할 월 (여러 번 지정 가능, 기본값: 명단의 모든 월)')
+    parser.add_argument('--merge', action='store_true',
+                        help='모든 입력 파일의 모든 시트를 하나의 명단으로 병합해 월별 PPT 생성')
+    parser.add_argument('--skip-invalid', action='store_true',
+                        help='--merge에서 오류가 있는 명단(시트)은 제외하고 나머지로 생성')
+    parser.add_argument('--template', help='템플릿 PPT 경로 (기본값: resources/templates/template.pptx)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='병렬로 PPT를 생성할 프로세스 수 (기본값: 1)')
+    parser.add_argument('--compression', default='default', choices=['stored', 'fast', 'default', 'max'],
+                        help='PPT(zip) 압축 설정 (기본값: default)')
+    parser.add_argument('--per-slide', type=int, default=1, metavar='N',
+                        help='슬라이드 한 장에 넣을 생일자 수 (기본값: 1, 2 이상이면 격자로 배치)')
+    parser.add_argument('--streaming', action='store_true',
+                        help='슬라이드를 만드는 대로 파일에 써서 메모리 사용량을 줄임 (생일자가 아주 많은 달용)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='이전 실행과 생일자 데이터/템플릿/폰트가 같은 PPT는 다시 만들지 않음')
+    parser.add_argument('--profile', metavar='REPORT.json',
+                        help='단계별 소요 시간 보고서(JSON) 저장 (-j 2 이상이면 작업 프로세스의 PPT 생성 단계는 빠짐)')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='--profile 보고서에 단계별 메모리 할당량도 기록 (실행이 느려짐)')
+    parser.add_argument('--cprofile', metavar='FILE.prof',
+                        help='cProfile 결과 저장 (python -m pstats 등으로 분석)')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='진행 로그 출력 (-v: 단계별 소요 시간, -vv: 슬라이드/서식 디버그 로그)')
+    return parser
+
+
+def print_warnings(report) -> None:
+    """검증은 통과했지만 경고(중복 이름, 빈 성별 등)가 있으면 항목을 출력"""
+    if report.warning_count:
+        print(report.summary(), file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.verbose:
+        logging.basicConfig(level=logging.DEBUG if args.verbose > 1 else logging.INFO,
+                            format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+    if not (args.profile or args.cprofile):
+        return run(args)
+
+    from profiling import Profiler
+    with Profiler(track_allocations=args.profile_memory, cprofile_path=args.cprofile) as profiler:
+        status = run(args, profiler)
+    if args.profile:
+        profiler.write_report(args.profile)
+        print(f"성능 보고서 저장: {args.profile}", file=sys.stderr)
+    if args.cprofile:
+        print(f"cProfile 결과 저장: {args.cprofile}", file=sys.stderr)
+    return status
+
+
+def run(args, profiler=None) -> int:
+    """명단을 읽어 PPT를 생성 (profiler를 지정하면 단계별 소요 시간을 기록)"""
+    # pandas / python-pptx는 인자 검증이 끝난 뒤에 로드 (--help 등은 즉시 응답)
+    from excel_processor import ExcelProcessor, expand_sources
+    from ppt_generator import (PPTGenerator, PPTGeneratorError, DeckJob, generate_ppt_parallel,
+                               output_file_name)
+
+    # 템플릿을 먼저 열어 자리표시자에 쓰인 명단 컬럼({부서} 등)을 확인
+    try:
+        ppt_generator = PPTGenerator(font_name=args.font, template_path=args.template,
+                                     people_per_slide=args.per_slide, profiler=profiler)
+    except PPTGeneratorError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+
+    # (출력 파일 이름 앞에 붙일 문자열, 검증된 명단) 목록
+    rosters = []
+    failed = False
+    if args.merge:
+        # 파일들은 CPU 수만큼의 프로세스에서 동시에 파싱
+        excel_processor = ExcelProcessor(extra_columns=ppt_generator.custom_fields, profiler=profiler)
+        success, message = excel_processor.read_sources(args.inputs, allow_multiple_months=True,
+                                                        skip_invalid=args.skip_invalid)
+        print(message, file=sys.stdout if success else sys.stderr)
+        failed = not success
+        if success:
+            print_warnings(excel_processor.validation_report)
+            rosters.append(('', excel_processor))
+    else:
+        input_paths = expand_sources(args.inputs)
+        for input_path in input_paths:
+            excel_processor = ExcelProcessor(extra_columns=ppt_generator.custom_fields, profiler=profiler)
+            success, message = excel_processor.read_excel(input_path, allow_multiple_months=True)
+            print(f"{input_path}: {message}")
+            if not success:
+                failed = True
+                continue
+            print_warnings(excel_processor.validation_report)
+
+            # 입력 파일이 여러 개면 파일 이름이 겹치지 않도록 원본 이름을 앞에 붙임
+            prefix = ''
+            if len(input_paths) > 1:
+                prefix = os.path.splitext(os.path.basename(input_path))[0] + '_'
+            rosters.append((prefix, excel_processor))
+
+    jobs = []
+    for prefix, excel_processor in rosters:
+        for month, birthday_list in excel_processor.get_birthdays_by_month().items():
+            if args.month and month not in args.month:
+                continue
+            jobs.append(DeckJob(month, birthday_list, prefix + output_file_name(month)))
+
+    if not jobs:
+        print("생성할 생일자 데이터가 없습니다.", file=sys.stderr)
+        return 1
+
+    if args.jobs > 1:
+        results = generate_ppt_parallel(jobs, args.output_dir, font_name=args.font,
+                                        max_workers=args.jobs, template_path=args.template,
+                                        incremental=args.incremental, compression=args.compression,
+                                        people_per_slide=args.per_slide, streaming=args.streaming)
+    else:
+        results = ppt_generator.generate_jobs(jobs, args.output_dir, incremental=args.incremental,
+                                              compression=args.compression, streaming=args.streaming)
+
+    for success, message in results:
+        print(message, file=sys.stdout if success else sys.stderr)
+        failed = failed or not success
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
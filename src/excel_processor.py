@@ -1,13 +1,146 @@
+import os
+import re
+import glob
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import List, Dict, Tuple
+from openpyxl import load_workbook
+from typing import List, Dict, Tuple, Optional, Sequence, NamedTuple, Union
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from birthday_record import BirthdayRecord
+from build_cache import file_digest
+from profiling import Profiler, profiled
+from roster_validation import (DEFAULT_MAX_ISSUES, ValidationIssue, ValidationReport, check_months,
+                               validate_roster)
+
+# 검증을 통과한 명단 캐시: (파일 내용 해시, 추가 컬럼) -> DataFrame (최근 사용 순, 최대 4개)
+_ROSTER_CACHE_SIZE = 4
+_roster_cache: 'OrderedDict[Tuple[str, Tuple[str, ...]], pd.DataFrame]' = OrderedDict()
+
+# 원본 옆에 저장하는 검증된 명단 캐시 형식 버전 (형식이 바뀌면 올림)
+_SIDECAR_VERSION = '2'
+
+# 엑셀 파일 확장자 (폴더를 지정하면 이 확장자의 파일만 읽음)
+EXCEL_EXTENSIONS = ('.xlsx', '.xlsm', '.xls')
+
+# 자회사/부서마다 다르게 쓰는 컬럼 이름 -> 표준 컬럼 이름 (공백과 대소문자는 무시하고 비교)
+COLUMN_ALIASES = {
+    '이름': '이름', '성명': '이름', 'name': '이름',
+    '성별': '성별', 'gender': '성별', 'sex': '성별',
+    '생년월일': '생년월일', '생일': '생년월일', 'birthdate': '생년월일', 'birthday': '생년월일',
+    'birth_date': '생년월일', 'dateofbirth': '생년월일', 'dob': '생년월일',
+}
+_ALIAS_LOOKUP = {re.sub(r'\s+', '', alias).lower(): column for alias, column in COLUMN_ALIASES.items()}
+
+def normalize_column(column) -> str:
+    """헤더 셀 값을 표준 컬럼 이름으로 변환 (별칭이 아니면 앞뒤 공백만 제거)"""
+    name = str(column).strip()
+    return _ALIAS_LOOKUP.get(re.sub(r'\s+', '', name).lower(), name)
+
+def _is_temporary(name: str) -> bool:
+    """숨김 파일(캐시 등)과 엑셀이 열려 있을 때 생기는 ~$ 임시 파일인지 확인"""
+    return name.startswith(('.', '~$'))
+
+def expand_sources(sources: Union[str, Sequence[str]]) -> List[str]:
+    """파일/폴더/glob 패턴(또는 그 목록)을 엑셀 파일 경로 목록으로 펼침 (중복 제거, 지정한 순서 유지)"""
+    if isinstance(sources, (str, os.PathLike)):
+        sources = [sources]
+    
+    paths = []
+    for source in map(str, sources):
+        if os.path.isdir(source):
+            paths.extend(
+                os.path.join(source, name) for name in sorted(os.listdir(source))
+                if name.lower().endswith(EXCEL_EXTENSIONS) and not _is_temporary(name)
+            )
+        elif glob.has_magic(source):
+            paths.extend(path for path in sorted(glob.glob(source)) if not _is_temporary(os.path.basename(path)))
+        else:
+            paths.append(source)
+    return list(dict.fromkeys(paths))
+
+class SourceReport(NamedTuple):
+    """명단 하나(파일의 시트 하나)의 읽기 결과"""
+    source: str
+    rows: int
+    error: Optional[str] = None
+    report: Optional[ValidationReport] = None
+
+class RosterPreview(NamedTuple):
+    """전체 검증 전에 보여줄 명단 요약"""
+    columns: List[str]  # 읽은 컬럼 (표준 이름)
+    rows: List[Tuple[str, ...]]  # 앞쪽 표본 행 (표시용 문자열)
+    row_count: Optional[int]  # 전체 행 수 (시트 정보에 없으면 None)
+    months: List[int]  # 감지된 월 (exact가 False이면 표본 행 기준)
+    missing_columns: List[str]  # 없는 필수 컬럼
+    exact: bool = False  # 검증된 캐시에서 얻은 정확한 값인지
+
+def _parse_source_file(file_path: str, extra_columns: Tuple[str, ...],
+                       allow_multiple_months: bool = False) -> List[Tuple[SourceReport, Optional[pd.DataFrame]]]:
+    """파일의 모든 시트를 읽어 검증 (프로세스 풀에서 실행, 시트별 (결과, 명단) 목록 반환)"""
+    processor = ExcelProcessor(use_cache=False, extra_columns=extra_columns)
+    name = os.path.basename(file_path)
+    try:
+        sheets = processor._load_sheets(file_path, all_sheets=True)
+    except Exception as e:
+        return [(SourceReport(name, 0, f"파일 읽기 오류: {str(e)}"), None)]
+    
+    results = []
+    for sheet_name, df in sheets:
+        # 필수 컬럼이 하나도 없는 시트(안내문, 요약 등)는 명단이 아니므로 건너뜀
+        if not any(col in df.columns for col in processor.REQUIRED_COLUMNS):
+            continue
+        source = f"{name} [{sheet_name}]" if len(sheets) > 1 else name
+        report = ValidationReport(processor.max_issues)
+        processor._validate_frame(df, report, allow_multiple_months)
+        error = report.summary() if report.has_errors else None
+        results.append((SourceReport(source, len(df), error, report), None if error else df))
+    if not results:
+        results.append((SourceReport(name, 0, "생일자 명단이 있는 시트가 없습니다."), None))
+    return results
+
+def _format_value(value) -> str:
+    """명단 셀 값을 슬라이드에 넣을 문자열로 변환 (빈 셀은 빈 문자열)"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        # 숫자 셀은 pandas가 실수로 읽으므로 3.0 -> 3
+        return str(int(value))
+    if isinstance(value, datetime):
+        return value.date().isoformat() if value.time() == datetime.min.time() else value.isoformat(sep=' ')
+    return str(value)
+
+def _remember_roster(key: Tuple[str, Tuple[str, ...]], df: pd.DataFrame) -> None:
+    _roster_cache[key] = df.copy()
+    _roster_cache.move_to_end(key)
+    while len(_roster_cache) > _ROSTER_CACHE_SIZE:
+        _roster_cache.popitem(last=False)
 
 class ExcelProcessor:
     REQUIRED_COLUMNS = ['이름', '성별', '생년월일']
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True, extra_columns: Sequence[str] = (),
+                 max_issues: int = DEFAULT_MAX_ISSUES, profiler: Optional[Profiler] = None):
+        # use_cache가 True이면 검증된 명단을 원본 옆 캐시 파일(.{파일명}.roster.npz)에 저장해 두고
+        # 원본이 바뀌지 않았으면 다음 실행에서 엑셀을 다시 파싱하지 않는다
+        self.use_cache = use_cache
+        # 필수 컬럼 외에 함께 읽을 컬럼 (템플릿의 {부서} 같은 자리표시자, 명단에 없으면 무시)
+        self.extra_columns: Tuple[str, ...] = tuple(
+            col for col in dict.fromkeys(extra_columns) if col not in self.REQUIRED_COLUMNS
+        )
         self.df = None
         self.detected_month = None
+        self.detected_months: List[int] = []
+        self.source_digest: Optional[str] = None
+        self.source_reports: List[SourceReport] = []
+        # 마지막 검증 결과 (오류/경고 항목은 종류별로 max_issues개까지 저장)
+        self.max_issues = max_issues
+        self.validation_report = ValidationReport(max_issues)
+        # 마지막으로 검증에 성공한 파일: (절대 경로, 크기, 수정 시각)
+        self._loaded_source: Optional[Tuple[str, int, int]] = None
+        # 지정하면 읽기/검증/변환 단계별 소요 시간을 기록
+        self.profiler = profiler
         
     def validate_columns(self, df: pd.DataFrame) -> bool:
         """필수 컬럼이 모두 있는지 확인"""
@@ -21,54 +154,372 @@ class ExcelProcessor:
         except ValueError:
             return False
     
-    def read_excel(self, file_path: str) -> Tuple[bool, str]:
-        """엑셀 파일 읽기 및 검증"""
+    @profiled('read_excel')
+    def read_excel(self, file_path: str, allow_multiple_months: bool = False) -> Tuple[bool, str]:
+        """엑셀 파일 읽기 및 검증
+        
+        allow_multiple_months가 True이면 여러 월이 섞인 명단(연간 명단 등)도 허용하고,
+        감지된 월 목록을 detected_months에 저장한다. 명단 전체를 한 번에 검증해
+        모든 오류/경고를 validation_report에 기록하고, 오류가 있으면 그 요약을 반환한다.
+        """
+        self.validation_report = ValidationReport(self.max_issues)
+        self._loaded_source = None
         try:
-            self.df = pd.read_excel(file_path)
+            stat = os.stat(file_path)
+            # 캐시 파일에는 필수 컬럼만 저장하므로 추가 컬럼이 필요하면 엑셀에서 읽음
+            use_sidecar = self.use_cache and not self.extra_columns
+            sidecar = self._read_sidecar(file_path) if use_sidecar else None
+            cached = None
+            if sidecar is not None:
+                # 원본이 바뀌지 않았으면 캐시 파일에서 바로 로드
+                self.source_digest, self.df = sidecar
+                _remember_roster((self.source_digest, self.extra_columns), self.df)
+            else:
+                self.source_digest = file_digest(file_path)
+                cache_key = (self.source_digest, self.extra_columns)
+                cached = _roster_cache.get(cache_key)
+                if cached is not None:
+                    # 내용이 같은 파일을 이미 검증했으면 파싱 결과 재사용
+                    _roster_cache.move_to_end(cache_key)
+                    self.df = cached.copy()
+                else:
+                    self.df = self._load_frame(file_path)
+                    if not self._validate_frame(self.df, self.validation_report, allow_multiple_months):
+                        return False, self.validation_report.summary()
+                    _remember_roster(cache_key, self.df)
+                    if use_sidecar:
+                        self._write_sidecar(file_path, self.df)
             
-            # 필수 컬럼 검증
-            if not self.validate_columns(self.df):
-                missing_cols = [col for col in self.REQUIRED_COLUMNS if col not in self.df.columns]
-                return False, f"필수 컬럼이 없습니다: {', '.join(missing_cols)}"
+            if sidecar is not None or cached is not None:
+                # 캐시된 명단은 날짜를 다시 파싱하지 않고 경고 항목만 다시 확인
+                self._validate_frame(self.df, self.validation_report)
+            success, message = self._detect_months(allow_multiple_months)
+            if success:
+                self._loaded_source = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+            return success, message
+            
+        except Exception as e:
+            return False, f"파일 읽기 오류: {str(e)}"
+    
+    def is_loaded(self, file_path: str) -> bool:
+        """file_path를 이미 읽어 검증했고 그 뒤로 파일이 바뀌지 않았는지 확인"""
+        if self._loaded_source is None or self.df is None:
+            return False
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        return self._loaded_source == (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+    
+    def preview(self, file_path: str, sample_rows: int = 20) -> RosterPreview:
+        """전체 파싱/검증 없이 앞쪽 sample_rows행만 읽어 명단을 요약 (파일을 읽을 수 없으면 예외 발생)
+        
+        원본이 바뀌지 않은 캐시 파일이 있으면 캐시에서 정확한 월과 행 수를 얻는다.
+        """
+        if self.use_cache and not self.extra_columns:
+            sidecar = self._read_sidecar(file_path)
+            if sidecar is not None:
+                df = sidecar[1]
+                months = sorted(int(month) for month in df['생년월일'].dt.month.unique())
+                return RosterPreview(list(df.columns), self._preview_rows(df.head(sample_rows)),
+                                     len(df), months, [], exact=True)
+        
+        row_count = None
+        if str(file_path).lower().endswith(('.xlsx', '.xlsm')):
+            workbook = load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                worksheet = workbook.worksheets[0]
+                # 시트에 기록된 크기 정보 기준 (헤더 제외, 빈 행 포함)
+                if worksheet.max_row:
+                    row_count = max(worksheet.max_row - 1, 0)
+                df = self._read_worksheet(worksheet, self.REQUIRED_COLUMNS + list(self.extra_columns),
+                                          max_rows=sample_rows)
+            finally:
+                workbook.close()
+        else:
+            df = self._load_sheets(file_path, max_rows=sample_rows)[0][1]
+        
+        months = []
+        if '생년월일' in df.columns:
+            birth_dates = pd.to_datetime(df['생년월일'].astype(str), format='%Y-%m-%d', errors='coerce')
+            months = sorted(int(month) for month in birth_dates.dropna().dt.month.unique())
+        missing = [col for col in self.REQUIRED_COLUMNS if col not in df.columns]
+        return RosterPreview(list(df.columns), self._preview_rows(df), row_count, months, missing)
+    
+    @staticmethod
+    def _preview_rows(df: pd.DataFrame) -> List[Tuple[str, ...]]:
+        return [tuple(_format_value(value) for value in row) for row in df.itertuples(index=False)]
+    
+    @profiled('read_sources')
+    def read_sources(self, sources: Union[str, Sequence[str]], allow_multiple_months: bool = False,
+                     skip_invalid: bool = False, max_workers: Optional[int] = None) -> Tuple[bool, str]:
+        """여러 엑셀 파일(폴더, glob 패턴, 경로 목록)의 모든 시트를 읽어 하나의 명단으로 병합
+        
+        파일은 프로세스 풀에서 동시에 파싱하고, 컬럼 이름은 표준 이름으로 맞춘다.
+        명단(시트)별 결과는 source_reports에 저장한다. skip_invalid가 True이면 오류가 있는
+        명단을 제외하고 나머지만 병합하며, False이면 하나라도 오류가 있으면 실패한다.
+        """
+        self.df = None
+        self.source_digest = None
+        self.source_reports = []
+        self.validation_report = ValidationReport(self.max_issues)
+        try:
+            paths = expand_sources(sources)
+            if not paths:
+                return False, "읽을 엑셀 파일이 없습니다."
             
-            # 데이터 형식 검증
-            invalid_dates = []
-            for idx, row in self.df.iterrows():
-                if not self.validate_date_format(str(row['생년월일'])):
-                    invalid_dates.append(f"{row['이름']}: {row['생년월일']}")
+            max_workers = min(max_workers or os.cpu_count() or 1, len(paths))
+            if max_workers > 1:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    parsed = list(executor.map(_parse_source_file, paths, [self.extra_columns] * len(paths),
+                                               [allow_multiple_months] * len(paths)))
+            else:
+                parsed = [_parse_source_file(path, self.extra_columns, allow_multiple_months) for path in paths]
             
-            if invalid_dates:
-                return False, f"잘못된 날짜 형식이 있습니다:\n{chr(10).join(invalid_dates)}"
+            frames = []
+            labels = []
+            for results in parsed:
+                for report, df in results:
+                    self.source_reports.append(report)
+                    if report.report is not None:
+                        self.validation_report.merge(report.report, report.source)
+                    elif report.error:
+                        self.validation_report.add(ValidationIssue(None, '', '', report.error, source=report.source))
+                    if df is not None:
+                        frames.append(df)
+                        labels.append(report.source)
             
-            # 데이터 전처리
-            self.df['생년월일'] = pd.to_datetime(self.df['생년월일'])
+            errors = [report.source for report in self.source_reports if report.error]
+            if not frames or (errors and not skip_invalid):
+                return False, self.validation_report.summary() if errors else "생일자 데이터가 없습니다."
             
-            # 월 감지
-            months = self.df['생년월일'].dt.month.unique()
-            if len(months) > 1:
-                return False, "서로 다른 월의 생일자가 포함되어 있습니다."
+            # 월이 다른 행을 원래 파일/행 번호로 보고할 수 있도록 병합 전에 기록
+            rows = np.concatenate([df.index.to_numpy() for df in frames])
+            sources = np.repeat(np.array(labels, dtype=object), [len(df) for df in frames])
             
-            self.detected_month = int(months[0])
-            return True, f"{self.detected_month}월 데이터 검증 성공"
+            # 명단마다 있는 추가 컬럼이 다를 수 있으므로 없는 값은 빈 칸으로 병합
+            self.df = pd.concat(frames, ignore_index=True, sort=False)
+            success, message = self._detect_months(allow_multiple_months, rows, sources)
+            if success:
+                rows = sum(len(df) for df in frames)
+                message = f"{len(frames)}개 명단에서 {rows}명 병합, {message}"
+                if errors:
+                    message += "\n제외된 명단: " + ', '.join(errors)
+            return success, message
             
         except Exception as e:
             return False, f"파일 읽기 오류: {str(e)}"
     
-    def get_birthdays(self) -> List[Dict]:
-        """생일자 목록 반환"""
+    def _detect_months(self, allow_multiple_months: bool, rows: Optional[np.ndarray] = None,
+                       sources: Optional[np.ndarray] = None) -> Tuple[bool, str]:
+        """검증된 명단의 월 감지 (여러 월을 허용하지 않으면 다른 월의 행을 오류로 기록)"""
+        report = self.validation_report
+        errors_before = report.error_count
+        months = check_months(self.df['생년월일'], report, allow_multiple_months, rows, sources)
+        if report.error_count > errors_before:
+            return False, report.summary()
+        if not months:
+            return False, "생일자 데이터가 없습니다."
+        
+        self.detected_months = months
+        self.detected_month = months[0] if len(months) == 1 else None
+        message = f"{', '.join(map(str, months))}월 데이터 검증 성공"
+        if report.warning_count:
+            message += f" (경고 {report.warning_count}건)"
+        return True, message
+    
+    @profiled('validate')
+    def _validate_frame(self, df: pd.DataFrame, report: ValidationReport,
+                        allow_multiple_months: bool = True) -> bool:
+        """명단 전체를 한 번에 검증해 report에 기록하고, 오류가 없으면 생년월일을 날짜로 변환
+        
+        오류가 있어도 여러 월을 허용하지 않으면 읽을 수 있는 날짜로 월 불일치까지 함께 기록해
+        한 번에 모든 문제를 보고한다 (오류가 없으면 월 확인은 _detect_months에서 한다).
+        """
+        birth_dates = validate_roster(df, report, self.REQUIRED_COLUMNS)
+        if report.has_errors:
+            if birth_dates is not None and not allow_multiple_months:
+                check_months(birth_dates.dropna(), report, allow_multiple_months)
+            return False
+        
+        # 데이터 전처리 (검증 시 파싱한 컬럼 재사용)
+        df['생년월일'] = birth_dates
+        return True
+    
+    @staticmethod
+    def _sidecar_path(file_path: str) -> str:
+        directory, name = os.path.split(os.path.abspath(file_path))
+        return os.path.join(directory, f".{name}.roster.npz")
+    
+    @profiled('read_cache')
+    def _read_sidecar(self, file_path: str) -> Optional[Tuple[str, pd.DataFrame]]:
+        """원본과 크기/수정 시각이 같은 캐시 파일이 있으면 (원본 해시, 명단) 반환"""
+        try:
+            stat = os.stat(file_path)
+            with np.load(self._sidecar_path(file_path), allow_pickle=False) as data:
+                version, digest, size, mtime_ns = data['meta'].tolist()
+                if version != _SIDECAR_VERSION or int(size) != stat.st_size or int(mtime_ns) != stat.st_mtime_ns:
+                    return None
+                roster = data['roster']
+                return digest, pd.DataFrame({
+                    '이름': roster['name'].tolist(),
+                    '성별': roster['gender'].tolist(),
+                    '생년월일': roster['birth_date'].astype('datetime64[ns]'),
+                }, index=roster['row'].astype(np.int64))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # 잘리거나 손상된 캐시(BadZipFile, EOFError 등)는 지우고 원본을 다시 읽는다
+            try:
+                os.remove(self._sidecar_path(file_path))
+            except OSError:
+                pass
+            return None
+    
+    @profiled('write_cache')
+    def _write_sidecar(self, file_path: str, df: pd.DataFrame) -> None:
+        """검증된 명단을 열 단위 이진 캐시로 저장 (pickle 없이 고정 길이 문자열/날짜 배열만 사용)"""
+        # 이름/성별이 모두 문자열일 때만 저장 (빈 값 등은 원본 파싱 결과와 달라질 수 있음)
+        if not all(isinstance(value, str) for col in ('이름', '성별') for value in df[col]):
+            return
+        
+        names = df['이름'].to_numpy(dtype=str)
+        genders = df['성별'].to_numpy(dtype=str)
+        roster = np.empty(len(df), dtype=[
+            ('row', 'int64'), ('name', names.dtype), ('gender', genders.dtype), ('birth_date', 'datetime64[ns]')
+        ])
+        # 검증 항목에 엑셀 행 번호를 표시할 수 있도록 함께 저장
+        roster['row'] = df.index.to_numpy(dtype=np.int64)
+        roster['name'] = names
+        roster['gender'] = genders
+        roster['birth_date'] = df['생년월일'].to_numpy(dtype='datetime64[ns]')
+        
+        sidecar_path = self._sidecar_path(file_path)
+        temp_path = sidecar_path + '.tmp'
+        try:
+            stat = os.stat(file_path)
+            meta = np.array([_SIDECAR_VERSION, self.source_digest, str(stat.st_size), str(stat.st_mtime_ns)])
+            with open(temp_path, 'wb') as f:
+                np.savez(f, meta=meta, roster=roster)
+            os.replace(temp_path, sidecar_path)
+        except OSError:
+            # 읽기 전용 폴더 등에서는 캐시 없이 동작
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    
+    @profiled('load_frame')
+    def _load_frame(self, file_path: str) -> pd.DataFrame:
+        """첫 번째 시트에서 필수 컬럼과 추가 컬럼만 읽어 DataFrame 생성"""
+        return self._load_sheets(file_path)[0][1]
+    
+    def _load_sheets(self, file_path: str, all_sheets: bool = False,
+                     max_rows: Optional[int] = None) -> List[Tuple[str, pd.DataFrame]]:
+        """시트별 (시트 이름, DataFrame) 목록 (all_sheets가 False이면 첫 번째 시트만, max_rows행까지)
+        
+        헤더는 표준 컬럼 이름으로 바꾸고 필수 컬럼과 추가 컬럼만 남긴다.
+        .xlsx 파일은 openpyxl 읽기 전용 모드로 행을 스트리밍하면서 필요한 셀만 모으므로
+        통합 문서 크기와 관계없이 메모리 사용량이 읽는 컬럼 분량으로 제한된다.
+        """
+        wanted = self.REQUIRED_COLUMNS + list(self.extra_columns)
+        if not str(file_path).lower().endswith(('.xlsx', '.xlsm')):
+            frames = pd.read_excel(file_path, sheet_name=None if all_sheets else 0, nrows=max_rows,
+                                   usecols=lambda col: normalize_column(col) in wanted)
+            if not all_sheets:
+                frames = {0: frames}
+            sheets = []
+            for sheet_name, df in frames.items():
+                df.columns = [normalize_column(col) for col in df.columns]
+                # 인덱스를 엑셀 행 번호로 맞춤 (1행은 헤더)
+                df.index = df.index + 2
+                # 컬럼 이름이 중복되면 첫 번째 컬럼 사용
+                sheets.append((str(sheet_name), df.loc[:, ~df.columns.duplicated()]))
+            return sheets
+        
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            worksheets = workbook.worksheets if all_sheets else workbook.worksheets[:1]
+            return [(worksheet.title, self._read_worksheet(worksheet, wanted, max_rows)) for worksheet in worksheets]
+        finally:
+            workbook.close()
+    
+    @staticmethod
+    def _read_worksheet(worksheet, wanted: List[str], max_rows: Optional[int] = None) -> pd.DataFrame:
+        rows = worksheet.iter_rows(values_only=True)
+        header = next(rows, ())
+        
+        # 컬럼 이름이 중복되면 첫 번째 컬럼 사용
+        indices = {}
+        for i, col in enumerate(header):
+            if col is None:
+                continue
+            col = normalize_column(col)
+            if col in wanted and col not in indices:
+                indices[col] = i
+        
+        columns = {col: [] for col in indices}
+        row_numbers = []
+        for row_number, row in enumerate(rows, start=2):
+            # 완전히 빈 행은 건너뜀 (pd.read_excel과 동일)
+            if all(value is None for value in row):
+                continue
+            if max_rows is not None and len(row_numbers) >= max_rows:
+                break
+            row_numbers.append(row_number)
+            for col, i in indices.items():
+                columns[col].append(row[i] if i < len(row) else None)
+        # 인덱스는 엑셀 행 번호 (검증 결과에 표시)
+        return pd.DataFrame(columns, index=row_numbers)
+    
+    @profiled('get_birthdays')
+    def get_birthdays(self, month: Optional[int] = None) -> List[BirthdayRecord]:
+        """생일자 목록 반환 (생일 날짜순, month 지정 시 해당 월만)"""
         if self.df is None:
             return []
         
-        # 결과를 리스트로 변환
-        birthday_list = []
-        for _, row in self.df.iterrows():
-            birthday_list.append({
-                '이름': row['이름'],
-                '성별': row['성별'],
-                '생년월일': row['생년월일'].strftime('%Y-%m-%d'),
-                '나이': datetime.now().year - row['생년월일'].year + 1
-            })
-        
-        # 생일 날짜순으로 정렬
-        birthday_list.sort(key=lambda x: x['생년월일'])
-        return birthday_list
\ No newline at end of file
+        df = self.df
+        if month is not None:
+            df = df[df['생년월일'].dt.month == month]
+        return self._to_records(df)
+    
+    @profiled('get_birthdays_by_month')
+    def get_birthdays_by_month(self) -> Dict[int, List[BirthdayRecord]]:
+        """월별 생일자 목록 반환 (명단을 한 번만 정렬한 뒤 월 단위로 묶음)"""
+        if self.df is None:
+            return {}
+        
+        sorted_df = self.df.sort_values('생년월일', kind='stable')
+        return {
+            int(month): self._to_records(group, presorted=True)
+            for month, group in sorted_df.groupby(sorted_df['생년월일'].dt.month, sort=True)
+        }
+    
+    @profiled('to_records')
+    def _to_records(self, df: pd.DataFrame, presorted: bool = False) -> List[BirthdayRecord]:
+        """DataFrame을 BirthdayRecord 목록으로 변환"""
+        # 생일 날짜순 정렬과 나이 계산을 컬럼 단위로 처리
+        sorted_df = df if presorted else df.sort_values('생년월일', kind='stable')
+        birth_dates = sorted_df['생년월일']
+        ages = datetime.now().year - birth_dates.dt.year + 1
+        
+        # 명단에 있는 추가 컬럼만 (컬럼 이름, 값) 쌍으로 묶음
+        extra_columns = [col for col in self.extra_columns if col in sorted_df.columns]
+        if extra_columns:
+            extras = zip(*(
+                [(col, _format_value(value)) for value in sorted_df[col].tolist()]
+                for col in extra_columns
+            ))
+        else:
+            extras = [()] * len(sorted_df)
+        
+        return [
+            BirthdayRecord(name, gender, birth_date, age, extra)
+            for name, gender, birth_date, age, extra in zip(
+                map(_format_value, sorted_df['이름'].tolist()),
+                map(_format_value, sorted_df['성별'].tolist()),
+                birth_dates.dt.date,
+                ages.tolist(),
+                extras
+            )
+        ]
@@ -1,11 +1,108 @@
+import os
 import sys
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QHBoxLayout, QLabel, QPushButton, QFileDialog, 
-                           QProgressBar, QMessageBox)
-from PyQt6.QtCore import Qt
+                           QProgressBar, QMessageBox, QTableWidget,
+                           QTableWidgetItem, QHeaderView, QAbstractItemView, QCheckBox)
+from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
 from excel_processor import ExcelProcessor
-from ppt_generator import PPTGenerator
+from ppt_generator import PPTGenerator, PPTGeneratorError
+from profiling import Profiler
+
+# 파일을 선택할 때 미리보기로 읽을 행 수
+PREVIEW_ROWS = 20
+# 성능 보고서를 켜면 저장 위치에 함께 만드는 파일
+PROFILE_REPORT_NAME = '생일PPT_성능보고서.json'
+
+
+class GenerationWorker(QObject):
+    """엑셀 처리와 PPT 생성을 GUI 스레드 밖에서 실행하는 작업자"""
+    progress = pyqtSignal(int, str)  # (진행률, 상태 메시지)
+    finished = pyqtSignal(bool, str, str)  # (성공 여부, 상태 메시지, 결과 메시지)
+    
+    def __init__(self, excel_path: str, save_path: str, ppt_generator: PPTGenerator,
+                 excel_processor: ExcelProcessor, profile: bool = False):
+        super().__init__()
+        self.excel_path = excel_path
+        self.save_path = save_path
+        self.ppt_generator = ppt_generator
+        self.excel_processor = excel_processor
+        self.profile = profile
+    
+    def is_cancelled(self) -> bool:
+        return self.thread().isInterruptionRequested()
+    
+    def run(self):
+        if not self.profile:
+            self.finished.emit(*self._generate())
+            return
+        
+        # 이 스레드에서 실행되는 단계만 측정하고, 끝나면 보고서를 저장 위치에 씀
+        profiler = Profiler()
+        self.ppt_generator.profiler = self.excel_processor.profiler = profiler
+        try:
+            with profiler:
+                success, status, message = self._generate()
+        finally:
+            self.ppt_generator.profiler = self.excel_processor.profiler = None
+        report_path = os.path.join(self.save_path, PROFILE_REPORT_NAME)
+        try:
+            profiler.write_report(report_path)
+            message += f"\n성능 보고서: {report_path}"
+        except OSError as e:
+            message += f"\n성능 보고서 저장 실패: {str(e)}"
+        self.finished.emit(success, status, message)
+    
+    def _generate(self):
+        """(성공 여부, 상태 메시지, 결과 메시지) 반환"""
+        # 엑셀 파일 처리 (이미 읽었고 그 뒤로 바뀌지 않았으면 다시 읽지 않음)
+        excel_processor = self.excel_processor
+        if not excel_processor.is_loaded(self.excel_path):
+            self.progress.emit(5, '엑셀 파일 읽는 중...')
+            success, message = excel_processor.read_excel(self.excel_path, allow_multiple_months=True)
+            
+            if not success:
+                return False, '엑셀 파일 처리 실패', message
+        
+        # 생일자 목록 가져오기 (월별로 묶음)
+        birthdays_by_month = excel_processor.get_birthdays_by_month()
+        
+        if not birthdays_by_month:
+            return False, '데이터 없음', '생일자 데이터가 없습니다.'
+        
+        # PPT 생성 (슬라이드 단위로 10% ~ 100% 구간 진행률 보고)
+        self.progress.emit(10, 'PPT 생성 중...')
+        
+        last_value = -1
+        
+        def report(done: int, total: int) -> None:
+            # 진행률(%)이 바뀔 때만 신호를 보내 이벤트 큐가 넘치지 않게 함
+            nonlocal last_value
+            value = 10 + 90 * done // total
+            if value != last_value:
+                last_value = value
+                self.progress.emit(value, f'PPT 생성 중... ({done}/{total})')
+        
+        results = self.ppt_generator.generate_batch(
+            birthdays_by_month,
+            self.save_path,
+            progress_callback=report,
+            is_cancelled=self.is_cancelled,
+            incremental=True
+        )
+        
+        if self.is_cancelled():
+            return False, 'PPT 생성 취소됨', 'PPT 생성이 취소되었습니다.'
+        
+        success = all(result_success for _, result_success, _ in results)
+        message = '\n'.join(result_message for _, _, result_message in results)
+        # 검증은 통과했지만 경고(중복 이름, 빈 성별 등)가 있으면 결과와 함께 보여줌
+        report = excel_processor.validation_report
+        if report.warning_count:
+            message += f"\n\n{report.summary()}"
+        return success, 'PPT 생성 완료' if success else 'PPT 생성 실패', message
+
 
 class BirthdayPPTApp(QMainWindow):
     def __init__(self):
@@ -13,13 +110,20 @@ class BirthdayPPTApp(QMainWindow):
         self.excel_path_label = None
         self.save_path_label = None
         self.month_label = None
+        self.preview_table = None
+        self.profile_checkbox = None
         self.progress_bar = None
         self.status_label = None
+        self.generate_button = None
+        self.ppt_generator = None
+        self.excel_processor = None
+        self.worker_thread = None
+        self.worker = None
         self.initUI()
         
     def initUI(self):
         self.setWindowTitle('생일 PPT 생성기')
-        self.setFixedSize(500, 400)
+        self.setFixedSize(500, 670)
         
         # 스타일 설정
         self.setStyleSheet("""
@@ -156,7 +260,18 @@ class BirthdayPPTApp(QMainWindow):
         
         layout.addWidget(month_group)
         
-        layout.addSpacing(16)
+        # 명단 미리보기 (앞쪽 몇 행만 읽어서 표시)
+        self.preview_table = QTableWidget()
+        self.preview_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.preview_table.verticalHeader().setVisible(False)
+        self.preview_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.preview_table.setStyleSheet("border: 1px solid #E5E7EB; border-radius: 6px; color: #374151;")
+        layout.addWidget(self.preview_table, stretch=1)
+        
+        # 단계별 소요 시간 보고서 (느린 원인을 찾을 때만 켬)
+        self.profile_checkbox = QCheckBox('성능 보고서 저장 (단계별 소요 시간)')
+        self.profile_checkbox.setStyleSheet("color: #6B7280; font-size: 12px;")
+        layout.addWidget(self.profile_checkbox)
         
         # 진행 상태 바
         self.progress_bar = QProgressBar()
@@ -164,16 +279,16 @@ class BirthdayPPTApp(QMainWindow):
         layout.addWidget(self.progress_bar)
         
         # 생성 버튼
-        generate_button = QPushButton('PPT 생성하기')
-        generate_button.setFixedHeight(50)
-        generate_button.setStyleSheet("""
+        self.generate_button = QPushButton('PPT 생성하기')
+        self.generate_button.setFixedHeight(50)
+        self.generate_button.setStyleSheet("""
             QPushButton {
                 font-size: 14px;
                 font-weight: bold;
             }
         """)
-        generate_button.clicked.connect(self.generate_ppt)
-        layout.addWidget(generate_button)
+        self.generate_button.clicked.connect(self.generate_ppt)
+        layout.addWidget(self.generate_button)
         
         # 상태 메시지
         self.status_label = QLabel('파일을 선택해주세요')
@@ -189,12 +304,23 @@ class BirthdayPPTApp(QMainWindow):
             "Excel Files (*.xlsx *.xls)"
         )
         if file_name:
-            excel_processor = ExcelProcessor()
-            success, message = excel_processor.read_excel(file_name)
-            
-            if not success:
-                QMessageBox.warning(self, '오류', message)
+            # 전체 파싱과 검증은 생성할 때 한 번만 하고, 여기서는 앞쪽 일부만 읽어서 보여줌
+            try:
+                ppt_generator = self.get_ppt_generator()
+            except PPTGeneratorError as e:
+                QMessageBox.warning(self, '오류', str(e))
+                return
+            # 템플릿에 {부서} 같은 자리표시자가 있으면 해당 컬럼도 함께 읽음
+            excel_processor = ExcelProcessor(extra_columns=ppt_generator.custom_fields)
+            try:
+                preview = excel_processor.preview(file_name, PREVIEW_ROWS)
+            except Exception as e:
+                QMessageBox.warning(self, '오류', f"파일 읽기 오류: {str(e)}")
                 return
+            if preview.missing_columns:
+                QMessageBox.warning(self, '오류', f"필수 컬럼이 없습니다: {', '.join(preview.missing_columns)}")
+                return
+            self.excel_processor = excel_processor
             
             self.excel_path_label.setText(file_name)
             self.excel_path_label.setStyleSheet("""
@@ -205,8 +331,10 @@ class BirthdayPPTApp(QMainWindow):
                 color: #374151;
             """)
             
-            # 감지된 월 표시
-            self.month_label.setText(f"{excel_processor.detected_month}월")
+            # 감지된 월 표시 (여러 월이면 월별로 한 번에 생성)
+            months = ', '.join(map(str, preview.months))
+            note = '' if preview.exact else f" (앞 {len(preview.rows)}행 기준)"
+            self.month_label.setText(f"{months}월{note}" if months else f"알 수 없음{note}")
             self.month_label.setStyleSheet("""
                 background-color: white;
                 border: 1px solid #2563EB;
@@ -215,7 +343,26 @@ class BirthdayPPTApp(QMainWindow):
                 color: #374151;
             """)
             
-            self.status_label.setText(message)
+            self.show_preview(preview)
+            if preview.row_count is None:
+                self.status_label.setText('파일이 선택되었습니다. 생성할 때 전체 명단을 검증합니다.')
+            else:
+                self.status_label.setText(f'{preview.row_count}행의 명단이 선택되었습니다. 생성할 때 전체 명단을 검증합니다.')
+    
+    def show_preview(self, preview):
+        self.preview_table.clear()
+        self.preview_table.setColumnCount(len(preview.columns))
+        self.preview_table.setHorizontalHeaderLabels(preview.columns)
+        self.preview_table.setRowCount(len(preview.rows))
+        for row, values in enumerate(preview.rows):
+            for column, value in enumerate(values):
+                self.preview_table.setItem(row, column, QTableWidgetItem(value))
+    
+    def get_ppt_generator(self) -> PPTGenerator:
+        # 생성기는 한 번만 만들어 재사용 (템플릿은 생성할 때마다 원본 상태로 초기화됨)
+        if self.ppt_generator is None:
+            self.ppt_generator = PPTGenerator(font_name="Pretendard")
+        return self.ppt_generator
             
     def select_save_path(self):
         folder_path = QFileDialog.getExistingDirectory(
@@ -234,6 +381,11 @@ class BirthdayPPTApp(QMainWindow):
             self.status_label.setText(f'저장 위치가 선택되었습니다: {folder_path}')
             
     def generate_ppt(self):
+        # 생성 중에는 버튼이 취소 버튼으로 동작
+        if self.worker_thread is not None:
+            self.cancel_generation()
+            return
+        
         if self.excel_path_label.text() == '선택된 파일 없음':
             QMessageBox.warning(self, '경고', '엑셀 파일을 선택해주세요.')
             return
@@ -241,47 +393,57 @@ class BirthdayPPTApp(QMainWindow):
             QMessageBox.warning(self, '경고', '저장 위치를 선택해주세요.')
             return
         
-        # 엑셀 파일 처리
-        self.status_label.setText('엑셀 파일 읽는 중...')
-        self.progress_bar.setValue(10)
-        
-        excel_processor = ExcelProcessor()
-        success, message = excel_processor.read_excel(self.excel_path_label.text())
-        
-        if not success:
-            QMessageBox.warning(self, '오류', message)
-            self.status_label.setText('엑셀 파일 처리 실패')
-            self.progress_bar.setValue(0)
-            return
-            
-        # 생일자 목록 가져오기
-        birthday_list = excel_processor.get_birthdays()
-        
-        if not birthday_list:
-            QMessageBox.information(self, '알림', '생일자 데이터가 없습니다.')
-            self.status_label.setText('데이터 없음')
-            self.progress_bar.setValue(0)
-            return
-            
-        # PPT 생성
-        self.status_label.setText('PPT 생성 중...')
-        self.progress_bar.setValue(50)
-        
-        ppt_generator = PPTGenerator(font_name="Pretendard")
-        success, message = ppt_generator.generate_ppt(
-            excel_processor.detected_month,
-            birthday_list,
-            self.save_path_label.text()
+        # 작업 스레드에서 엑셀 처리와 PPT 생성 실행
+        self.progress_bar.setValue(0)
+        self.worker_thread = QThread(self)
+        self.worker = GenerationWorker(
+            self.excel_path_label.text(),
+            self.save_path_label.text(),
+            self.ppt_generator,
+            self.excel_processor,
+            self.profile_checkbox.isChecked()
         )
+        self.worker.moveToThread(self.worker_thread)
+        self.worker_thread.started.connect(self.worker.run)
+        self.worker.progress.connect(self.on_generation_progress)
+        self.worker.finished.connect(self.on_generation_finished)
+        self.worker.finished.connect(self.worker_thread.quit)
+        self.worker_thread.finished.connect(self.worker.deleteLater)
+        self.worker_thread.finished.connect(self.worker_thread.deleteLater)
+        
+        self.generate_button.setText('취소하기')
+        self.worker_thread.start()
+    
+    def cancel_generation(self):
+        self.status_label.setText('취소하는 중...')
+        self.generate_button.setEnabled(False)
+        self.worker_thread.requestInterruption()
+    
+    def on_generation_progress(self, value: int, status: str):
+        self.progress_bar.setValue(value)
+        self.status_label.setText(status)
+    
+    def on_generation_finished(self, success: bool, status: str, message: str):
+        self.worker_thread = None
+        self.worker = None
+        self.generate_button.setText('PPT 생성하기')
+        self.generate_button.setEnabled(True)
+        self.status_label.setText(status)
         
         if success:
-            self.status_label.setText('PPT 생성 완료')
             self.progress_bar.setValue(100)
             QMessageBox.information(self, '완료', message)
         else:
-            self.status_label.setText('PPT 생성 실패')
             self.progress_bar.setValue(0)
             QMessageBox.warning(self, '오류', message)
+    
+    def closeEvent(self, event):
+        # 생성 중에 창을 닫으면 작업을 취소하고 스레드 종료를 기다림
+        if self.worker_thread is not None:
+            self.worker_thread.requestInterruption()
+            self.worker_thread.quit()
+            self.worker_thread.wait()
+        super().closeEvent(event)
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
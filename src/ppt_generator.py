@@ -1,187 +1,622 @@
 from pptx import Presentation
-from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, NamedTuple, Callable, IO
 import os
+import math
+import time
+import hashlib
+import logging
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 from io import BytesIO
+from copy import deepcopy
 from pptx.util import Pt
+from pptx.text.text import Font
+from lxml import etree
+from pptx.oxml.ns import qn
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.parts.slide import SlidePart
+from birthday_record import BirthdayRecord
+from build_cache import DeckManifest, deck_digest
+from profiling import Profiler, profiled, stage as profile_stage
+from pptx_writer import Compression, SharedPartCache, StreamingDeckWriter, save_presentation
+from template_fields import (BUILTIN_FIELDS, compile_element, compiled_fields, deck_values,
+                             record_values, render_element, scan_fields)
+
+logger = logging.getLogger(__name__)
 
 class PPTGeneratorError(Exception):
     pass
 
+# 템플릿 원본 캐시: 절대 경로 -> (수정 시각, 파일 크기, 템플릿 바이트, SHA-256 해시)
+_template_cache: Dict[str, Tuple[int, int, bytes, str]] = {}
+
+def _default_template_path() -> str:
+    """실행 파일 기준 상대 경로의 기본 템플릿"""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(current_dir, '..', 'resources', 'templates', 'template.pptx')
+
+def _load_template(template_path: str) -> Tuple[bytes, str]:
+    """템플릿 파일 바이트와 해시 반환 (경로와 수정 시각이 같으면 다시 읽지 않음)"""
+    path = os.path.abspath(template_path)
+    stat = os.stat(path)
+    cached = _template_cache.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2], cached[3]
+    
+    with open(path, 'rb') as f:
+        template_bytes = f.read()
+    template_digest = hashlib.sha256(template_bytes).hexdigest()
+    _template_cache[path] = (stat.st_mtime_ns, stat.st_size, template_bytes, template_digest)
+    return template_bytes, template_digest
+
+def output_file_name(month: int) -> str:
+    """월별 PPT 기본 파일 이름"""
+    return f"{month}월_생일자.pptx"
+
+# 진행 상황 콜백: (완료한 슬라이드 수, 전체 슬라이드 수)
+ProgressCallback = Callable[[int, int], None]
+
+class DeckJob(NamedTuple):
+    """생성할 PPT 한 개의 작업 정보 (file_name이 없으면 '{month}월_생일자.pptx')"""
+    month: int
+    birthday_list: List[BirthdayRecord]
+    file_name: Optional[str] = None
+
+def _check_fresh(manifest: DeckManifest, job: DeckJob, template_digest: str,
+                 font_name: str, people_per_slide: int) -> Tuple[str, str, bool]:
+    """(파일 이름, 입력 해시, 이전 결과를 그대로 쓸 수 있는지 여부) 반환"""
+    file_name = job.file_name or output_file_name(job.month)
+    digest = deck_digest(job.birthday_list, job.month, template_digest, font_name, people_per_slide)
+    return file_name, digest, manifest.is_fresh(file_name, digest)
+
+def _skipped_message(save_path: str, file_name: str) -> str:
+    return f"변경 사항이 없어 기존 PPT를 유지합니다: {os.path.join(save_path, file_name)}"
+
+# 서식 적용 결과 캐시: (원본 a:rPr XML, 대상 a:rPr XML, 폰트) -> 서식이 적용된 a:rPr
+# 같은 서식의 런은 python-pptx 속성을 하나씩 읽고 쓰지 않고 완성된 요소를 복제해 붙인다
+_FONT_FORMAT_CACHE_SIZE = 256
+_font_format_cache: Dict[Tuple[bytes, bytes, str], object] = {}
+
+# 여러 명 배치 모드에서 글자 크기를 지정하지 않은 런의 기준 크기 (PowerPoint 텍스트박스 기본값 18pt)
+_DEFAULT_FONT_SIZE = 1800
+
+def _grid_shape(people_per_slide: int) -> Tuple[int, int]:
+    """한 슬라이드에 people_per_slide명을 놓을 (열, 행) 수 (가로가 긴 슬라이드라 열을 먼저 늘림)"""
+    cols = math.ceil(math.sqrt(people_per_slide))
+    return cols, math.ceil(people_per_slide / cols)
+
+def _scale_textbox(sp, scale: float) -> None:
+    """텍스트박스 XML의 크기와 글자 크기를 scale배로 조정"""
+    sp.cx = int(sp.cx * scale)
+    sp.cy = int(sp.cy * scale)
+    for rPr in sp.iter(qn('a:rPr'), qn('a:endParaRPr'), qn('a:defRPr')):
+        size = rPr.get('sz')
+        if size is None and rPr.tag != qn('a:rPr'):
+            continue
+        size = int(size) if size is not None else _DEFAULT_FONT_SIZE
+        rPr.set('sz', str(max(100, round(size * scale))))
+
 class PPTGenerator:
-    def __init__(self, font_name="Maplestory OTF"):
-        # 템플릿 파일 경로 설정 (실행 파일 기준 상대 경로)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        self.template_path = os.path.join(current_dir, '..', 'resources', 'templates', 'template.pptx')
+    def __init__(self, font_name="Maplestory OTF", template_path: Optional[str] = None,
+                 people_per_slide: int = 1, profiler: Optional[Profiler] = None):
+        # 템플릿 파일 경로 설정 (지정하지 않으면 실행 파일 기준 상대 경로)
+        self.template_path = template_path or _default_template_path()
         
         if not os.path.exists(self.template_path):
             raise PPTGeneratorError(f"템플릿 파일을 찾을 수 없습니다: {self.template_path}")
             
         # 기본 폰트 설정
         self.font_name = font_name
+        
+        # 슬라이드 한 장에 넣을 생일자 수 (2 이상이면 템플릿 텍스트를 격자로 축소 배치)
+        self._validate_people_per_slide(people_per_slide)
+        self.people_per_slide = people_per_slide
             
-        # 템플릿 로드
+        # 단계별 소요 시간(초)과 카운터 (generate_ppt를 호출할 때마다 새로 집계)
+        self.stats: Dict[str, float] = {}
+        # 지정하면 stats의 단계와 슬라이드별 생성 시간을 함께 기록 (여러 번 생성하면 누적)
+        self.profiler = profiler
+        # 여러 PPT를 만들 때 바뀌지 않은 템플릿 파트(마스터, 레이아웃, 테마, 미디어)의 압축 결과를 재사용
+        self._shared_parts = SharedPartCache()
+        
+        # 템플릿 로드 (캐시된 원본 바이트를 보관해 두고 생성할 때마다 새로 연다)
+        start = time.perf_counter()
         try:
-            self.prs = Presentation(self.template_path)
+            with profile_stage(profiler, 'template_load'):
+                self._template_bytes, self.template_digest = _load_template(self.template_path)
+                self.prs = self._load_presentation()
             if len(self.prs.slides) < 2:
                 raise PPTGeneratorError("템플릿에는 최소 2개의 슬라이드가 필요합니다")
+            self.template_fields = self._scan_template_fields()
         except Exception as e:
             raise PPTGeneratorError(f"템플릿 파일 로드 실패: {str(e)}")
+        self.stats['template_load'] = time.perf_counter() - start
+        # 다음 생성은 템플릿을 다시 읽지 않으므로 여기서 읽은 시간을 그 생성의 stats에 넣는다
+        self._pending_template_load: Optional[float] = self.stats['template_load']
+        self._prs_used = False
+        self._next_slide_id = None
+        self._blueprint = None
+        self._blueprint_layout = None
+        self._blueprint_fields = frozenset()
+        self._grid = None
+
+    def _load_presentation(self):
+        """보관된 템플릿 바이트로부터 새 프레젠테이션 생성"""
+        return Presentation(BytesIO(self._template_bytes))
+
+    def _reset_presentation(self) -> None:
+        """이전 생성으로 변경된 프레젠테이션을 템플릿 원본 상태로 되돌림"""
+        # 템플릿 파일이 수정되었으면 캐시에서 새 바이트를 받아온다
+        self._template_bytes, self.template_digest = _load_template(self.template_path)
+        self.prs = self._load_presentation()
+        self.template_fields = self._scan_template_fields()
+        self._prs_used = False
+        self._next_slide_id = None
+        self._blueprint = None
+        self._grid = None
+
+    def _scan_template_fields(self) -> frozenset:
+        """타이틀/생일자 템플릿 슬라이드에 쓰인 자리표시자 이름"""
+        slides = self.prs.slides
+        return scan_fields(slides[0]._element) | scan_fields(slides[1]._element)
+
+    @property
+    def custom_fields(self) -> List[str]:
+        """템플릿에 쓰인 필드 중 명단에서 읽어야 하는 컬럼 (ExcelProcessor의 extra_columns로 전달)"""
+        return sorted(self.template_fields - BUILTIN_FIELDS)
+
+    @contextmanager
+    def _timed(self, stage: str):
+        """stage 단계의 소요 시간을 stats에 누적 (프로파일러가 있으면 같은 이름으로 기록)"""
+        start = time.perf_counter()
+        try:
+            with profile_stage(self.profiler, stage):
+                yield
+        finally:
+            self.stats[stage] = self.stats.get(stage, 0.0) + time.perf_counter() - start
 
     def set_font(self, font_name: str) -> None:
         """폰트 변경"""
         self.font_name = font_name
+        self._blueprint = None
+        self._grid = None
+
+    def set_people_per_slide(self, people_per_slide: int) -> None:
+        """슬라이드 한 장에 넣을 생일자 수 변경"""
+        self._validate_people_per_slide(people_per_slide)
+        self.people_per_slide = people_per_slide
+        self._grid = None
 
-    def create_birthday_slide(self, person: Dict) -> None:
-        """생일자 슬라이드 생성"""
+    @profiled('create_birthday_slide')
+    def create_birthday_slide(self, person: BirthdayRecord) -> None:
+        """생일자 슬라이드 생성 (컴파일된 청사진에 치환된 텍스트만 찍어냄)"""
         try:
-            template_slide = self.prs.slides[1]
-            new_slide = self.prs.slides.add_slide(template_slide.slide_layout)
+            if self._blueprint is None:
+                self._blueprint = self._compile_slide_blueprint()
             
-            # 템플릿의 도형들 복사
-            for shape in template_slide.shapes:
-                if hasattr(shape, 'shape_type'):
-                    left = shape.left
-                    top = shape.top
-                    width = shape.width
-                    height = shape.height
-                    
-                    if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                        # 이미지 복사
-                        image = new_slide.shapes.add_picture(
-                            image_file=BytesIO(shape.image.blob),
-                            left=left, top=top,
-                            width=width, height=height
-                        )
-                    elif shape.shape_type == MSO_SHAPE_TYPE.TEXT_BOX:
-                        # 텍스트박스 복사
-                        textbox = new_slide.shapes.add_textbox(
-                            left=left, top=top,
-                            width=width, height=height
-                        )
-                        
-                        if shape.has_text_frame and shape.text:
-                            # 원본 텍스트프레임과 새 텍스트프레임
-                            orig_text_frame = shape.text_frame
-                            new_text_frame = textbox.text_frame
-                            
-                            # 텍스트프레임 속성 복사
-                            new_text_frame.word_wrap = orig_text_frame.word_wrap
-                            
-                            # 단락별로 복사
-                            for i, orig_paragraph in enumerate(orig_text_frame.paragraphs):
-                                if i == 0:
-                                    new_paragraph = new_text_frame.paragraphs[0]
-                                else:
-                                    new_paragraph = new_text_frame.add_paragraph()
-                                
-                                # 단락 속성 복사
-                                new_paragraph.alignment = orig_paragraph.alignment
-                                new_paragraph.level = orig_paragraph.level
-                                
-                                # 텍스트 복사 및 치환
-                                text = orig_paragraph.text
-                                if text:
-                                    birth_date = datetime.strptime(person['생년월일'], '%Y-%m-%d')
-                                    text = text.replace("{name}", person['이름'])
-                                    text = text.replace("{month}", str(birth_date.month))
-                                    text = text.replace("{day}", str(birth_date.day))
-                                    
-                                    new_paragraph.text = text
-                                    
-                                    # 런(서식 단위)별로 복사
-                                    if len(orig_paragraph.runs) > 0:
-                                        orig_run = orig_paragraph.runs[0]
-                                        new_run = new_paragraph.runs[0]
-                                        
-                                        # 폰트 속성 복사
-                                        self._apply_font_format(orig_run.font, new_run.font)
-                                        
-                                       
+            values = record_values(person, self._blueprint_fields)
+            new_slide = self._add_slide(self._blueprint_layout)
+            shapes = new_slide.shapes
+            
+            for kind, *spec in self._blueprint:
+                if kind == 'picture':
+                    # 이미지는 한 번 등록한 이미지 파트를 관계(rId)로만 참조
+                    left, top, width, height, image_part = spec
+                    rId = new_slide.part.relate_to(image_part, RT.IMAGE)
+                    shapes._add_pic_from_image_part(image_part, rId, left, top, width, height)
+                else:
+                    template_sp, compiled = spec
+                    self._add_textbox(shapes, template_sp, compiled, values)
                             
-            print(f"{person['이름']}의 슬라이드 생성 완료")
+            logger.debug("%s의 슬라이드 생성 완료", person.name)
                             
         except Exception as e:
-            print(f"슬라이드 생성 중 오류: {str(e)}")
+            logger.error("슬라이드 생성 중 오류: %s", e)
             raise PPTGeneratorError(f"슬라이드 생성 오류: {str(e)}")
+
+    @profiled('create_group_slide')
+    def create_group_slide(self, people: List[BirthdayRecord]) -> None:
+        """생일자 여러 명을 한 슬라이드에 격자로 배치 (이미지는 슬라이드마다 한 번만 넣음)"""
+        try:
+            if self._blueprint is None:
+                self._blueprint = self._compile_slide_blueprint()
+            if self._grid is None:
+                self._grid = self._compile_grid()
+            cells, entries = self._grid
+            
+            new_slide = self._add_slide(self._blueprint_layout)
+            shapes = new_slide.shapes
+            
+            for kind, *spec in self._blueprint:
+                if kind == 'picture':
+                    left, top, width, height, image_part = spec
+                    rId = new_slide.part.relate_to(image_part, RT.IMAGE)
+                    shapes._add_pic_from_image_part(image_part, rId, left, top, width, height)
+            
+            for (cell_left, cell_top), person in zip(cells, people):
+                values = record_values(person, self._blueprint_fields)
+                for template_sp, compiled, dx, dy in entries:
+                    sp = self._add_textbox(shapes, template_sp, compiled, values)
+                    sp.x = cell_left + dx
+                    sp.y = cell_top + dy
+            
+            logger.debug("%d명의 슬라이드 생성 완료", len(people))
+            
+        except Exception as e:
+            logger.error("슬라이드 생성 중 오류: %s", e)
+            raise PPTGeneratorError(f"슬라이드 생성 오류: {str(e)}")
+
+    def _add_slide(self, layout):
+        """prs.slides.add_slide와 같은 슬라이드 추가 (슬라이드 수에 비례하는 검색을 건너뜀)
+        
+        새 슬라이드 파트는 기존 관계와 겹칠 수 없으므로 중복 관계를 찾지 않고,
+        슬라이드 ID는 매번 전체 ID의 최댓값을 구하는 대신 이어서 매긴다.
+        """
+        presentation_part = self.prs.part
+        sldIdLst = presentation_part._element.get_or_add_sldIdLst()
+        if self._next_slide_id is None:
+            self._next_slide_id = sldIdLst._next_id
+        partname = PackURI('/ppt/slides/slide%d.xml' % (len(sldIdLst) + 1))
+        slide_part = SlidePart.new(partname, presentation_part.package, layout.part)
+        rId = presentation_part._rels._add_relationship(RT.SLIDE, slide_part)
+        slide = slide_part.slide
+        slide.shapes.clone_layout_placeholders(layout)
+        sldIdLst._add_sldId(id=self._next_slide_id, rId=rId)
+        self._next_slide_id += 1
+        return slide
+
+    def _add_textbox(self, shapes, template_sp, compiled, values: Dict[str, str]):
+        """미리 만들어 둔 텍스트박스 XML을 복제해 자리표시자만 치환한 뒤 슬라이드에 추가"""
+        sp = deepcopy(template_sp)
+        shape_id = shapes._next_shape_id
+        sp.nvSpPr.cNvPr.id = shape_id
+        sp.nvSpPr.cNvPr.name = f"TextBox {shape_id - 1}"
+        render_element(sp, compiled, values)
+        shapes._spTree.insert_element_before(sp, 'p:extLst')
+        return sp
+
+    def _compile_grid(self) -> Tuple[List[Tuple[int, int]], List[tuple]]:
+        """격자 배치 청사진: (칸별 왼쪽 위 좌표 목록, 축소된 텍스트박스 목록) 반환
+        
+        템플릿 슬라이드의 텍스트박스 전체를 하나의 묶음으로 보고, 슬라이드를 열x행 칸으로 나눠
+        각 칸에 들어가도록 묶음 전체를 같은 비율로 축소한 뒤 칸 가운데에 놓는다.
+        """
+        textboxes = [spec for kind, *spec in self._blueprint if kind == 'textbox']
+        if not textboxes:
+            raise PPTGeneratorError("템플릿 슬라이드에 텍스트박스가 없습니다")
+        
+        # 텍스트박스 묶음의 경계 상자
+        left = min(sp.x for sp, _ in textboxes)
+        top = min(sp.y for sp, _ in textboxes)
+        right = max(sp.x + sp.cx for sp, _ in textboxes)
+        bottom = max(sp.y + sp.cy for sp, _ in textboxes)
+        
+        cols, rows = _grid_shape(self.people_per_slide)
+        cell_width = self.prs.slide_width // cols
+        cell_height = self.prs.slide_height // rows
+        scale = min(cell_width / max(right - left, 1), cell_height / max(bottom - top, 1), 1.0)
+        
+        # 축소된 묶음을 칸 가운데에 놓기 위한 여백
+        margin_x = int((cell_width - (right - left) * scale) / 2)
+        margin_y = int((cell_height - (bottom - top) * scale) / 2)
+        cells = [
+            (col * cell_width + margin_x, row * cell_height + margin_y)
+            for row in range(rows) for col in range(cols)
+        ][:self.people_per_slide]
+        
+        entries = []
+        for template_sp, compiled in textboxes:
+            sp = deepcopy(template_sp)
+            _scale_textbox(sp, scale)
+            entries.append((sp, compiled, int((template_sp.x - left) * scale),
+                            int((template_sp.y - top) * scale)))
+        return cells, entries
+
+    def _compile_slide_blueprint(self) -> List[tuple]:
+        """템플릿 슬라이드를 한 번만 분석해 도형 청사진 생성
+        
+        이미지는 위치/크기와 공유할 이미지 파트를, 텍스트박스는 서식까지 적용된 XML과
+        자리표시자 위치를 컴파일한 결과를 저장한다. 텍스트박스 XML은 임시 슬라이드에 만든 뒤 떼어낸다.
+        """
+        template_slide = self.prs.slides[1]
+        self._blueprint_layout = template_slide.slide_layout
+        scratch_slide = self.prs.slides.add_slide(self._blueprint_layout)
+        
+        package = self.prs.part.package
+        
+        try:
+            blueprint = []
+            fields = set()
+            for shape in template_slide.shapes:
+                if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+                    # 같은 이미지는 패키지에 한 번만 등록 (이미 있으면 기존 파트 재사용)
+                    image_part = package.get_or_add_image_part(BytesIO(shape.image.blob))
+                    blueprint.append(('picture', shape.left, shape.top,
+                                      shape.width, shape.height, image_part))
+                elif shape.shape_type == MSO_SHAPE_TYPE.TEXT_BOX:
+                    textbox = self._copy_textbox(scratch_slide.shapes, shape)
+                    sp = deepcopy(textbox._element)
+                    compiled = compile_element(sp)
+                    fields |= compiled_fields(compiled)
+                    blueprint.append(('textbox', sp, compiled))
+            self._blueprint_fields = frozenset(fields)
+            return blueprint
+        finally:
+            # 임시 슬라이드 제거
+            xml_slides = self.prs.slides._sldIdLst
+            scratch_id = list(xml_slides)[-1]
+            xml_slides.remove(scratch_id)
+            self.prs.part.drop_rel(scratch_id.rId)
+
+    def _copy_textbox(self, shapes, shape):
+        """템플릿 텍스트박스를 서식과 함께 복사 (자리표시자는 그대로 둠)"""
+        textbox = shapes.add_textbox(
+            left=shape.left, top=shape.top,
+            width=shape.width, height=shape.height
+        )
         
-    def create_title_slide(self, month: int) -> None:
-        """월별 타이틀 슬라이드 수정"""
+        if shape.has_text_frame and shape.text:
+            # 원본 텍스트프레임과 새 텍스트프레임
+            orig_text_frame = shape.text_frame
+            new_text_frame = textbox.text_frame
+            
+            # 텍스트프레임 속성 복사
+            new_text_frame.word_wrap = orig_text_frame.word_wrap
+            
+            # 단락별로 복사
+            for i, orig_paragraph in enumerate(orig_text_frame.paragraphs):
+                if i == 0:
+                    new_paragraph = new_text_frame.paragraphs[0]
+                else:
+                    new_paragraph = new_text_frame.add_paragraph()
+                
+                # 단락 속성 복사
+                new_paragraph.alignment = orig_paragraph.alignment
+                new_paragraph.level = orig_paragraph.level
+                
+                # 런(서식 단위)과 줄바꿈을 순서대로 복사 (런마다 원래 서식 유지)
+                if orig_paragraph.text:
+                    orig_runs = iter(orig_paragraph.runs)
+                    for child in orig_paragraph._p.content_children:
+                        orig_run = next(orig_runs) if child.tag == qn('a:r') else None
+                        if child.tag == qn('a:br'):
+                            new_paragraph._p.add_br()
+                        elif child.text:
+                            new_run = new_paragraph.add_run()
+                            new_run.text = child.text
+                            if orig_run is not None:
+                                self._apply_font_format(orig_run.font, new_run.font)
+        return textbox
+        
+    @profiled('create_title_slide')
+    def create_title_slide(self, month: int, values: Optional[Dict[str, str]] = None) -> None:
+        """월별 타이틀 슬라이드 수정 (values를 지정하지 않으면 {month}/{월}만 치환)"""
         try:
-            print(f"\n타이틀 슬라이드 수정 (월: {month})")
+            if values is None:
+                values = {'month': str(month), '월': str(month)}
+            logger.debug("타이틀 슬라이드 수정 (월: %s)", month)
             title_slide = self.prs.slides[0]
             
-            print("현재 도형들의 텍스트:")
-            for shape in title_slide.shapes:
-                if shape.has_text_frame:
-                    print(f"- {shape.text}")
+            if logger.isEnabledFor(logging.DEBUG):
+                for shape in title_slide.shapes:
+                    if shape.has_text_frame:
+                        logger.debug("현재 도형의 텍스트: %s", shape.text)
                         
             for shape in title_slide.shapes:
                 if shape.has_text_frame:
-                    text_frame = shape.text_frame
+                    # 자리표시자를 런 단위로 치환 (런마다 원래 서식 유지)
+                    render_element(shape._element, compile_element(shape._element), values)
                     
-                    # 단락별로 처리
-                    for i, paragraph in enumerate(text_frame.paragraphs):
-                        # 원본 속성 저장
-                        original_font = None
-                        if len(paragraph.runs) > 0:
-                            original_font = paragraph.runs[0].font
-
-                        if "{month}" in paragraph.text:
-                            original_text = paragraph.text
-                            new_text = original_text.replace("{month}", str(month))
-                            
-                            # 텍스트 설정
-                            paragraph.text = new_text
-                            
-                            # 새로운 런에 원본 속성 적용
-                            if len(paragraph.runs) > 0 and original_font:
-                                new_run = paragraph.runs[0]
-                                # 모든 폰트 속성 복사
-                                self._apply_font_format(original_font, new_run.font)
-                                print(f"텍스트 교체: {original_text} -> {new_text}")
-                        else:
-                            # month가 포함되지 않은 텍스트(HAPPY BIRTHDAY 등)도 폰트 적용
-                            if len(paragraph.runs) > 0:
-                                run = paragraph.runs[0]
-                                # 모든 폰트 속성 복사
-                                self._apply_font_format(original_font, run.font)
+                    # 모든 런에 폰트 적용 (자리표시자가 없는 HAPPY BIRTHDAY 등 포함)
+                    for paragraph in shape.text_frame.paragraphs:
+                        for run in paragraph.runs:
+                            self._apply_font_format(run.font, run.font)
+                    logger.debug("타이틀 텍스트: %s", shape.text)
 
         except Exception as e:
-            print(f"타이틀 슬라이드 수정 중 오류: {str(e)}")
+            logger.error("타이틀 슬라이드 수정 중 오류: %s", e)
             raise PPTGeneratorError(f"타이틀 슬라이드 수정 오류: {str(e)}")
 
-    def generate_ppt(self, month: int, birthday_list: List[Dict], save_path: str) -> Tuple[bool, str]:
+    def generate_ppt(self, month: int, birthday_list: List[BirthdayRecord], save_path: str,
+                     file_name: Optional[str] = None,
+                     progress_callback: Optional[ProgressCallback] = None,
+                     is_cancelled: Optional[Callable[[], bool]] = None,
+                     compression: Compression = 'default',
+                     streaming: bool = False) -> Tuple[bool, str]:
+        """월별 PPT를 save_path 폴더에 생성
+        
+        progress_callback은 생일자 슬라이드를 하나 만들 때마다 (완료 수, 전체 수)로 호출되고,
+        is_cancelled가 True를 반환하면 파일을 저장하지 않고 생성을 중단한다.
+        compression은 'stored', 'fast', 'default', 'max' 또는 deflate 수준(0~9)이다.
+        streaming이 True이면 슬라이드를 만드는 대로 파일에 써서 생일자가 많아도 메모리를 적게 쓴다.
+        """
         try:
-            print(f"\nPPT 생성 시작:")
-            print(f"- 월: {month}")
-            print(f"- 생일자 수: {len(birthday_list)}")
-            print(f"- 저장 경로: {save_path}")
-            
+            logger.info("PPT 생성 시작 (월: %s, 생일자 수: %d, 저장 경로: %s)",
+                        month, len(birthday_list), save_path)
             self._validate_save_path(save_path)
-            self._validate_birthday_data(birthday_list)
-            
-            self.create_title_slide(month)
+            output_path = os.path.join(save_path, file_name or output_file_name(month))
+            if streaming:
+                self._stream_presentation(month, birthday_list, output_path, compression,
+                                          progress_callback, is_cancelled)
+            else:
+                self._build_presentation(month, birthday_list, progress_callback, is_cancelled)
+                with self._timed('save'):
+                    save_presentation(self.prs, output_path, compression, self._shared_parts)
+            logger.info("파일 저장 완료: %s", output_path)
+            logger.info("단계별 소요 시간: %s", self.stats)
             
-            for person in birthday_list:
-                self.create_birthday_slide(person)
+            return True, f"PPT 파일이 생성되었습니다: {output_path}"
             
-            # 템플릿 슬라이드 제거
+        except Exception as e:
+            logger.error("PPT 생성 실패: %s", e)
+            return False, f"PPT 생성 실패: {str(e)}"
+
+    def render(self, month: int, birthday_list: List[BirthdayRecord],
+               stream: Optional[IO[bytes]] = None,
+               compression: Compression = 'default') -> Optional[bytes]:
+        """월별 PPT를 파일 없이 메모리에서 생성
+        
+        stream을 지정하면 그 바이너리 스트림(탐색 불가능해도 됨)에 쓰고 None을 반환하며,
+        지정하지 않으면 PPT 바이트를 반환한다. 실패하면 PPTGeneratorError를 발생시킨다.
+        """
+        try:
+            self._build_presentation(month, birthday_list)
+            target = stream if stream is not None else BytesIO()
+            with self._timed('save'):
+                save_presentation(self.prs, target, compression, self._shared_parts)
+            return None if stream is not None else target.getvalue()
+        except PPTGeneratorError:
+            raise
+        except Exception as e:
+            raise PPTGeneratorError(f"PPT 생성 실패: {str(e)}")
+
+    def _stream_presentation(self, month: int, birthday_list: List[BirthdayRecord], output_path: str,
+                             compression: Compression,
+                             progress_callback: Optional[ProgressCallback] = None,
+                             is_cancelled: Optional[Callable[[], bool]] = None) -> None:
+        """슬라이드를 만드는 대로 임시 파일에 쓰고, 완성되면 output_path로 바꿈 (실패하면 임시 파일 삭제)"""
+        partial_path = output_path + '.part'
+        try:
+            with StreamingDeckWriter(partial_path, compression, self._shared_parts) as writer:
+                self._build_presentation(month, birthday_list, progress_callback, is_cancelled, writer)
+                with self._timed('save'):
+                    writer.finish(self.prs.part.package)
+            os.replace(partial_path, output_path)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+
+    def _build_presentation(self, month: int, birthday_list: List[BirthdayRecord],
+                            progress_callback: Optional[ProgressCallback] = None,
+                            is_cancelled: Optional[Callable[[], bool]] = None,
+                            slide_writer: Optional[StreamingDeckWriter] = None) -> None:
+        """템플릿으로 타이틀과 생일자 슬라이드를 만들고 템플릿 슬라이드를 제거
+        
+        slide_writer를 지정하면 완성된 생일자 슬라이드를 바로 쓰고 XML을 해제한다.
+        """
+        self.stats = {'slide_count': 0}
+        self._validate_birthday_data(birthday_list)
+        
+        # 이미 한 번 생성에 사용된 프레젠테이션이면 템플릿 원본으로 초기화
+        if self._prs_used:
+            with self._timed('template_load'):
+                self._reset_presentation()
+        elif self._pending_template_load is not None:
+            self.stats['template_load'] = self._pending_template_load
+            self._pending_template_load = None
+        self._prs_used = True
+        
+        with self._timed('title'):
+            self.create_title_slide(month, deck_values(month, len(birthday_list)))
+        
+        total = len(birthday_list)
+        per_slide = self.people_per_slide
+        with self._timed('slides'):
+            for start in range(0, total, per_slide):
+                if is_cancelled is not None and is_cancelled():
+                    raise PPTGeneratorError("사용자가 생성을 취소했습니다")
+                if per_slide == 1:
+                    self.create_birthday_slide(birthday_list[start])
+                else:
+                    self.create_group_slide(birthday_list[start:start + per_slide])
+                if slide_writer is not None:
+                    with profile_stage(self.profiler, 'write_slide'):
+                        slide_writer.write_slide(self._last_slide_part())
+                self.stats['slide_count'] = self.stats['slide_count'] + 1
+                if progress_callback is not None:
+                    progress_callback(min(start + per_slide, total), total)
+        
+        # 템플릿 슬라이드 제거
+        with profile_stage(self.profiler, 'remove_template_slide'):
             xml_slides = self.prs.slides._sldIdLst
             slides = list(xml_slides)
             xml_slides.remove(slides[1])
-            print("템플릿 슬라이드 제거됨")
-            
-            output_path = os.path.join(save_path, f"{month}월_생일자.pptx")
-            self.prs.save(output_path)
-            print(f"파일 저장 완료: {output_path}")
+        logger.debug("템플릿 슬라이드 제거됨")
+
+    def _last_slide_part(self):
+        """마지막으로 추가한 슬라이드의 파트 (Slide 객체를 새로 만들지 않도록 관계로 직접 찾음)"""
+        presentation_part = self.prs.part
+        return presentation_part.related_part(presentation_part._element.sldIdLst[-1].rId)
+
+    def generate_jobs(self, jobs: List[DeckJob], save_path: str,
+                      progress_callback: Optional[ProgressCallback] = None,
+                      is_cancelled: Optional[Callable[[], bool]] = None,
+                      incremental: bool = False,
+                      compression: Compression = 'default',
+                      streaming: bool = False) -> List[Tuple[bool, str]]:
+        """여러 PPT를 차례로 생성 (작업 순서대로 결과 반환)
+        
+        진행 상황은 모든 작업의 슬라이드를 합친 기준으로 보고하고, 취소되면 남은 작업은
+        생성하지 않는다. incremental이 True이면 저장 위치의 생성 기록과 비교해
+        생일자 데이터, 템플릿, 폰트가 모두 같은 PPT는 다시 만들지 않는다.
+        streaming은 generate_ppt와 같다.
+        """
+        # 생성기를 오래 쓰는 동안 템플릿 파일이 바뀌었으면 새 템플릿으로 비교하고 생성
+        # (바뀌지 않았으면 파일 정보만 확인하므로 비용이 거의 없음)
+        try:
+            _, template_digest = _load_template(self.template_path)
+        except OSError:
+            # 읽을 수 없으면 PPT를 만들 때 오류로 보고됨
+            template_digest = self.template_digest
+        if template_digest != self.template_digest:
+            start = time.perf_counter()
+            self._reset_presentation()
+            self._pending_template_load = time.perf_counter() - start
+        
+        grand_total = sum(len(job.birthday_list) for job in jobs)
+        completed = 0
+        
+        def report(done: int, total: int) -> None:
+            progress_callback(completed + done, grand_total)
+        
+        manifest = DeckManifest(save_path) if incremental else None
+        results = []
+        for job in jobs:
+            if is_cancelled is not None and is_cancelled():
+                break
             
-            return True, f"PPT 파일이 생성되었습니다: {output_path}"
+            file_name = job.file_name or output_file_name(job.month)
+            if manifest is not None:
+                file_name, digest, fresh = _check_fresh(manifest, job, self.template_digest,
+                                                       self.font_name, self.people_per_slide)
+                if fresh:
+                    logger.info("변경 사항 없음, 건너뜀: %s", file_name)
+                    results.append((True, _skipped_message(save_path, file_name)))
+                    completed += len(job.birthday_list)
+                    if progress_callback is not None and grand_total:
+                        progress_callback(completed, grand_total)
+                    continue
             
-        except Exception as e:
-            print(f"PPT 생성 실패: {str(e)}")
-            return False, f"PPT 생성 실패: {str(e)}"
+            success, message = self.generate_ppt(
+                job.month, job.birthday_list, save_path, file_name,
+                progress_callback=report if progress_callback is not None else None,
+                is_cancelled=is_cancelled,
+                compression=compression,
+                streaming=streaming
+            )
+            if manifest is not None and success:
+                manifest.update(file_name, digest)
+            results.append((success, message))
+            completed += len(job.birthday_list)
+        
+        if manifest is not None:
+            manifest.save()
+        return results
+
+    def generate_batch(self, birthdays_by_month: Dict[int, List[BirthdayRecord]], save_path: str,
+                       progress_callback: Optional[ProgressCallback] = None,
+                       is_cancelled: Optional[Callable[[], bool]] = None,
+                       incremental: bool = False) -> List[Tuple[int, bool, str]]:
+        """여러 월의 PPT를 한 번에 생성 (월별 결과 목록 반환, 옵션은 generate_jobs와 동일)"""
+        months = sorted(birthdays_by_month)
+        results = self.generate_jobs(
+            [DeckJob(month, birthdays_by_month[month]) for month in months], save_path,
+            progress_callback=progress_callback, is_cancelled=is_cancelled, incremental=incremental
+        )
+        return [(month, success, message) for month, (success, message) in zip(months, results)]
 
     def _validate_save_path(self, save_path: str) -> None:
         if not os.path.exists(save_path):
@@ -189,15 +624,17 @@ class PPTGenerator:
         if not os.access(save_path, os.W_OK):
             raise PPTGeneratorError(f"저장 경로에 쓰기 권한이 없습니다: {save_path}")
 
-    def _validate_birthday_data(self, birthday_list: List[Dict]) -> None:
+    def _validate_people_per_slide(self, people_per_slide: int) -> None:
+        if not isinstance(people_per_slide, int) or people_per_slide < 1:
+            raise PPTGeneratorError(f"슬라이드당 인원은 1 이상이어야 합니다: {people_per_slide}")
+
+    def _validate_birthday_data(self, birthday_list: List[BirthdayRecord]) -> None:
         if not birthday_list:
             raise PPTGeneratorError("생일자 데이터가 비어있습니다")
         
-        required_fields = {'이름', '성별', '생년월일', '나이'}
         for person in birthday_list:
-            missing_fields = required_fields - set(person.keys())
-            if missing_fields:
-                raise PPTGeneratorError(f"필수 필드가 누락되었습니다: {', '.join(missing_fields)}")
+            if not isinstance(person, BirthdayRecord):
+                raise PPTGeneratorError(f"잘못된 생일자 데이터 형식입니다: {type(person).__name__}")
             
     def _copy_font_color(self, orig_font, new_font):
         """폰트 색상 복사 (투명도 포함)"""
@@ -207,7 +644,7 @@ class PPTGenerator:
                 rgb = orig_font.color.rgb
                 if rgb is not None:
                     new_font.color.rgb = rgb
-                    print(f"RGB 색상 복사: {rgb}")
+                    logger.debug("RGB 색상 복사: %s", rgb)
             elif hasattr(orig_font.color, 'theme_color'):
                 # 테마 색상인 경우
                 theme_color = orig_font.color.theme_color
@@ -215,19 +652,38 @@ class PPTGenerator:
                     new_font.color.theme_color = theme_color
                     if hasattr(orig_font.color, 'brightness'):
                         new_font.color.brightness = orig_font.color.brightness
-                    print(f"테마 색상 복사: {theme_color}")
+                    logger.debug("테마 색상 복사: %s", theme_color)
             
             # 투명도 처리
             if hasattr(orig_font.color, 'alpha'):
                 alpha = orig_font.color.alpha
                 if alpha is not None:
                     new_font.color.alpha = alpha
-                    print(f"투명도 복사: {alpha}")
+                    logger.debug("투명도 복사: %s", alpha)
         except Exception as e:
-            print(f"색상 복사 중 오류 (무시됨): {str(e)}")
+            logger.debug("색상 복사 중 오류 (무시됨): %s", e)
 
     def _apply_font_format(self, orig_font, new_font):
-        """모든 폰트 서식 적용"""
+        """모든 폰트 서식 적용 (같은 서식 조합은 한 번만 계산하고 결과 a:rPr을 복제)"""
+        orig_rPr, new_rPr = orig_font._rPr, new_font._rPr
+        key = (etree.tostring(orig_rPr),
+               b'' if new_rPr is orig_rPr else etree.tostring(new_rPr),
+               self.font_name)
+        formatted = _font_format_cache.get(key)
+        if formatted is None:
+            # 대상 요소의 복사본에 서식을 적용해 결과를 보관
+            # (font.color를 읽기만 해도 python-pptx가 a:solidFill을 추가하므로 원본도 복사본에서 읽어
+            #  캐시 적중 여부와 관계없이 템플릿 요소가 바뀌지 않게 함)
+            formatted = deepcopy(new_rPr)
+            source = Font(formatted) if new_rPr is orig_rPr else Font(deepcopy(orig_rPr))
+            self._format_font(source, Font(formatted))
+            if len(_font_format_cache) >= _FONT_FORMAT_CACHE_SIZE:
+                _font_format_cache.clear()
+            _font_format_cache[key] = formatted
+        new_rPr.getparent().replace(new_rPr, deepcopy(formatted))
+
+    def _format_font(self, orig_font, new_font):
+        """폰트 속성을 하나씩 복사"""
         # 기본 폰트 설정
         new_font.name = self.font_name
         
@@ -243,7 +699,85 @@ class PPTGenerator:
         new_font.italic = orig_font.italic
         new_font.underline = orig_font.underline
         
-        print(f"폰트 정보:")
-        print(f"- 이름: {new_font.name}")
-        print(f"- 크기: {new_font.size}")
-        print(f"- 색상 정보: {new_font.color._element.xml if hasattr(new_font.color, '_element') else 'No color info'}")
\ No newline at end of file
+        # font.color 접근 시 python-pptx가 a:solidFill을 만들므로 기존 출력과 같도록 항상 접근
+        new_color = new_font.color
+        
+        # 색상 XML 직렬화는 비용이 크므로 디버그 로그가 켜져 있을 때만 수행
+        if logger.isEnabledFor(logging.DEBUG):
+            color_xml = new_color._element.xml if hasattr(new_color, '_element') else 'No color info'
+            logger.debug("폰트 정보: 이름=%s, 크기=%s, 색상=%s", new_font.name, new_font.size, color_xml)
+
+
+# 작업 프로세스마다 한 번만 만드는 생성기 (템플릿을 프로세스당 한 번만 로드)
+_worker_generator: Optional[PPTGenerator] = None
+_worker_error: Optional[str] = None
+
+
+def _init_worker(font_name: str, template_path: Optional[str], people_per_slide: int) -> None:
+    global _worker_generator, _worker_error
+    try:
+        _worker_generator = PPTGenerator(font_name=font_name, template_path=template_path,
+                                         people_per_slide=people_per_slide)
+    except PPTGeneratorError as e:
+        _worker_error = str(e)
+
+
+def _run_worker_job(job: DeckJob, save_path: str, compression: Compression,
+                    streaming: bool = False) -> Tuple[bool, str]:
+    if _worker_generator is None:
+        return False, f"PPT 생성 실패: {_worker_error}"
+    return _worker_generator.generate_ppt(job.month, job.birthday_list, save_path, job.file_name,
+                                          compression=compression, streaming=streaming)
+
+
+def generate_ppt_parallel(jobs: List[DeckJob], save_path: str, font_name: str = "Maplestory OTF",
+                          max_workers: Optional[int] = None,
+                          template_path: Optional[str] = None,
+                          incremental: bool = False,
+                          compression: Compression = 'default',
+                          people_per_slide: int = 1,
+                          streaming: bool = False) -> List[Tuple[bool, str]]:
+    """여러 PPT를 프로세스 풀에서 병렬 생성 (작업 순서대로 결과 반환)
+    
+    incremental이 True이면 바뀌지 않은 PPT는 작업 프로세스로 보내지 않는다.
+    streaming은 PPTGenerator.generate_ppt와 같다.
+    """
+    results: List[Optional[Tuple[bool, str]]] = [None] * len(jobs)
+    pending = list(enumerate(jobs))
+    
+    manifest = None
+    digests: Dict[int, Tuple[str, str]] = {}
+    if incremental:
+        try:
+            _, template_digest = _load_template(template_path or _default_template_path())
+        except OSError:
+            # 템플릿을 읽을 수 없으면 작업 프로세스가 오류를 보고하도록 그대로 진행
+            template_digest = None
+        if template_digest is not None:
+            manifest = DeckManifest(save_path)
+            pending = []
+            for i, job in enumerate(jobs):
+                file_name, digest, fresh = _check_fresh(manifest, job, template_digest, font_name, people_per_slide)
+                if fresh:
+                    results[i] = (True, _skipped_message(save_path, file_name))
+                else:
+                    digests[i] = (file_name, digest)
+                    pending.append((i, job._replace(file_name=file_name)))
+    
+    if pending:
+        max_workers = min(max_workers or os.cpu_count() or 1, len(pending))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(font_name, template_path, people_per_slide)) as executor:
+            futures = [(i, job, executor.submit(_run_worker_job, job, save_path, compression,
+                                                          streaming)) for i, job in pending]
+            for i, job, future in futures:
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    results[i] = (False, f"PPT 생성 실패 ({job.month}월): {str(e)}")
+                if manifest is not None and results[i][0]:
+                    manifest.update(*digests[i])
+    
+    if manifest is not None:
+        manifest.save()
+    return results
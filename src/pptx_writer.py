@@ -0,0 +1,208 @@
+import time
+import zipfile
+import zlib
+from copy import copy
+from typing import IO, Dict, NamedTuple, Optional, Tuple, Union
+
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+
+# 압축 설정 이름 -> (zip 압축 방식, 압축 수준)
+#  - stored: 압축하지 않음 (요청 즉시 내려주는 용도, CPU 사용 최소)
+#  - fast: 가장 빠른 deflate
+#  - default: python-pptx의 prs.save와 같은 설정
+#  - max: 가장 작은 파일 (보관용)
+COMPRESSION_PRESETS = {
+    'stored': (zipfile.ZIP_STORED, None),
+    'fast': (zipfile.ZIP_DEFLATED, 1),
+    'default': (zipfile.ZIP_DEFLATED, None),
+    'max': (zipfile.ZIP_DEFLATED, 9),
+}
+
+Compression = Union[str, int]
+
+# 생성할 때마다 내용이 달라지는 슬라이드 파트 (공유 파트 캐시에 넣지 않음)
+_PER_DECK_PREFIX = 'ppt/slides/'
+
+
+def resolve_compression(compression: Compression) -> Tuple[int, Optional[int]]:
+    """압축 설정 이름 또는 deflate 수준(0~9)을 (zip 압축 방식, 압축 수준)으로 변환"""
+    if isinstance(compression, int) and not isinstance(compression, bool):
+        if not 0 <= compression <= 9:
+            raise ValueError(f"압축 수준은 0~9 사이여야 합니다: {compression}")
+        if compression == 0:
+            return zipfile.ZIP_STORED, None
+        return zipfile.ZIP_DEFLATED, compression
+    try:
+        return COMPRESSION_PRESETS[compression]
+    except KeyError:
+        raise ValueError(
+            f"알 수 없는 압축 설정입니다: {compression} ({', '.join(COMPRESSION_PRESETS)} 또는 0~9)"
+        ) from None
+
+
+class _CompressedMember(NamedTuple):
+    data: bytes  # 압축 전 내용 (다음 PPT의 내용과 비교용)
+    zinfo: zipfile.ZipInfo  # CRC와 크기가 채워진 항목 정보
+    payload: bytes  # zip에 그대로 쓸 압축된 바이트
+
+
+def _compress_member(name: str, data: bytes, compress_type: int,
+                     compress_level: Optional[int]) -> _CompressedMember:
+    """zipfile.writestr와 같은 설정으로 한 항목을 미리 압축"""
+    zinfo = zipfile.ZipInfo(name)
+    zinfo.compress_type = compress_type
+    zinfo.external_attr = 0o600 << 16
+    zinfo.file_size = len(data)
+    zinfo.CRC = zlib.crc32(data)
+    if compress_type == zipfile.ZIP_DEFLATED:
+        level = zlib.Z_DEFAULT_COMPRESSION if compress_level is None else compress_level
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        payload = compressor.compress(data) + compressor.flush()
+    else:
+        payload = data
+    zinfo.compress_size = len(payload)
+    return _CompressedMember(data, zinfo, payload)
+
+
+# _write_compressed가 사용하는 zipfile.ZipFile 내부 속성 (CPython 3.10~3.13의 writestr 구현 기준)
+# 하나라도 없으면 아무것도 쓰기 전에 AttributeError를 내서 writestr로 대신 쓰게 한다
+_ZIPFILE_INTERNALS = ('_lock', '_writing', '_seekable', '_writecheck', 'start_dir', 'filelist', 'NameToInfo')
+
+
+def _write_compressed(zip_file: zipfile.ZipFile, member: _CompressedMember) -> None:
+    """미리 압축한 항목을 다시 압축하지 않고 zip에 씀 (크기와 CRC를 알고 있으므로 헤더를 먼저 씀)
+
+    ZipFile.writestr가 하는 일을 공개 API 없이 직접 하므로 _ZIPFILE_INTERNALS에 의존한다.
+    """
+    missing = [name for name in _ZIPFILE_INTERNALS if not hasattr(zip_file, name)]
+    if missing:
+        raise AttributeError(f"zipfile.ZipFile에 필요한 내부 속성이 없습니다: {', '.join(missing)}")
+    zinfo = copy(member.zinfo)
+    zinfo.date_time = time.localtime(time.time())[:6]
+    with zip_file._lock:
+        if zip_file._writing:
+            raise ValueError("다른 항목을 쓰는 중에는 미리 압축한 항목을 쓸 수 없습니다")
+        if zip_file._seekable:
+            zip_file.fp.seek(zip_file.start_dir)
+        zinfo.header_offset = zip_file.fp.tell()
+        zip_file._writecheck(zinfo)
+        zip_file._didModify = True
+        zip_file.fp.write(zinfo.FileHeader(False))
+        zip_file.fp.write(member.payload)
+        zip_file.start_dir = zip_file.fp.tell()
+        zip_file.filelist.append(zinfo)
+        zip_file.NameToInfo[zinfo.filename] = zinfo
+
+
+class SharedPartCache:
+    """여러 PPT에 똑같이 들어가는 파트(마스터, 레이아웃, 테마, 미디어 등)의 압축 결과를 재사용
+
+    슬라이드 외의 항목은 처음 쓸 때 압축한 바이트를 보관해 두고, 다음 PPT에서 내용이 같으면
+    다시 압축하지 않고 그대로 쓴다. 내용이 바뀐 항목(프레젠테이션 파트 등)은 새로 압축해 교체하므로
+    템플릿이 바뀌어도 예전 바이트를 쓰지 않는다.
+    """
+
+    def __init__(self):
+        self._members: Dict[Tuple[str, int, Optional[int]], _CompressedMember] = {}
+        self.hits = 0
+        self.misses = 0
+        # zipfile 내부 구현이 달라 미리 압축한 항목을 쓸 수 없으면 이후로는 writestr만 사용
+        self._supported = True
+
+    def write(self, zip_file: zipfile.ZipFile, name: str, data: bytes) -> None:
+        if not self._supported or name.startswith(_PER_DECK_PREFIX):
+            zip_file.writestr(name, data)
+            return
+        key = (name, zip_file.compression, zip_file.compresslevel)
+        member = self._members.get(key)
+        if member is not None and (member.data is data or member.data == data):
+            self.hits += 1
+        else:
+            self.misses += 1
+            member = _compress_member(name, data, zip_file.compression, zip_file.compresslevel)
+            self._members[key] = member
+        try:
+            _write_compressed(zip_file, member)
+        except AttributeError:
+            self._supported = False
+            self._members.clear()
+            zip_file.writestr(name, data)
+
+
+def _member_writer(zip_file: zipfile.ZipFile, shared_parts: Optional[SharedPartCache]):
+    """zip 항목을 쓰는 함수 (shared_parts가 있으면 미리 압축한 공유 파트를 재사용)"""
+    if shared_parts is None:
+        return zip_file.writestr
+    return lambda name, data: shared_parts.write(zip_file, name, data)
+
+
+def save_presentation(prs, file: Union[str, IO[bytes]], compression: Compression = 'default',
+                      shared_parts: Optional[SharedPartCache] = None) -> None:
+    """프레젠테이션을 경로나 바이너리 스트림에 저장 (python-pptx의 PackageWriter와 같은 구성)
+
+    스트림은 탐색(seek)이 불가능해도 된다. 압축 수준만 prs.save와 다르게 지정할 수 있다.
+    여러 PPT를 저장할 때 같은 shared_parts를 넘기면 바뀌지 않은 템플릿 파트는 다시 압축하지 않는다.
+    """
+    compress_type, compress_level = resolve_compression(compression)
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+
+    with zipfile.ZipFile(file, 'w', compression=compress_type, compresslevel=compress_level,
+                         strict_timestamps=False) as zip_file:
+        write = _member_writer(zip_file, shared_parts)
+        write(CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        write(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        for part in parts:
+            write(part.partname.membername, part.blob)
+            if part._rels:
+                write(part.partname.rels_uri.membername, part.rels.xml)
+
+
+class StreamingDeckWriter:
+    """완성된 슬라이드를 바로 zip에 쓰고 XML을 해제하는 저장기 (최대 메모리가 슬라이드 수와 거의 무관)
+
+    write_slide로 슬라이드 파트를 만들어지는 대로 쓰고, 마지막에 finish로 프레젠테이션 파트와
+    나머지 템플릿 파트, 관계, 콘텐츠 형식을 쓴다. 쓴 슬라이드는 XML이 해제되므로 다시 수정할 수 없다.
+    """
+
+    def __init__(self, file: Union[str, IO[bytes]], compression: Compression = 'default',
+                 shared_parts: Optional[SharedPartCache] = None):
+        compress_type, compress_level = resolve_compression(compression)
+        self._zip_file = zipfile.ZipFile(file, 'w', compression=compress_type, compresslevel=compress_level,
+                                         strict_timestamps=False)
+        self._write = _member_writer(self._zip_file, shared_parts)
+        self._written = set()
+
+    def __enter__(self) -> 'StreamingDeckWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write_slide(self, slide_part) -> None:
+        """슬라이드 파트와 관계를 쓰고 XML 트리를 해제 (파트 이름과 관계는 finish를 위해 남겨 둠)"""
+        self._write_part(slide_part)
+        slide_part._element = None
+        # add_slide가 만든 Slide 객체도 같은 XML을 참조하므로 함께 버림
+        slide_part.__dict__.pop('slide', None)
+
+    def finish(self, package) -> None:
+        """아직 쓰지 않은 파트와 패키지 관계, 콘텐츠 형식을 쓰고 파일을 닫음"""
+        parts = tuple(package.iter_parts())
+        for part in parts:
+            if part.partname not in self._written:
+                self._write_part(part)
+        self._write(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        self._write(CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        self.close()
+
+    def close(self) -> None:
+        self._zip_file.close()
+
+    def _write_part(self, part) -> None:
+        self._write(part.partname.membername, part.blob)
+        if part._rels:
+            self._write(part.partname.rels_uri.membername, part.rels.xml)
+        self._written.add(part.partname)
@@ -0,0 +1,147 @@
+import cProfile
+import functools
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional
+
+# 프로파일러가 없을 때 쓰는 빈 컨텍스트 (매번 새로 만들지 않고 재사용)
+_NULL_STAGE = nullcontext()
+
+
+def stage(profiler: Optional['Profiler'], name: str):
+    """profiler의 name 단계를 측정하는 컨텍스트 (profiler가 None이면 아무것도 하지 않음)"""
+    return _NULL_STAGE if profiler is None else profiler.stage(name)
+
+
+def profiled(name: str):
+    """메서드 전체를 self.profiler의 name 단계로 측정하는 데코레이터 (profiler가 None이면 바로 호출)"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = self.profiler
+            if profiler is None:
+                return method(self, *args, **kwargs)
+            with profiler.stage(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class _StageTotals:
+    __slots__ = ('count', 'total', 'max', 'allocated', 'peak')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.allocated = 0
+        self.peak = 0
+
+
+class _Frame:
+    """진행 중인 단계의 메모리 추적 상태"""
+    __slots__ = ('start_memory', 'peak')
+
+    def __init__(self, start_memory: int):
+        self.start_memory = start_memory
+        self.peak = start_memory
+
+
+class Profiler:
+    """단계별 소요 시간(과 선택적으로 메모리 할당)을 모으는 프로파일러
+
+    with 블록 안에서 ExcelProcessor/PPTGenerator에 profiler로 넘겨 사용한다.
+    track_allocations가 True이면 tracemalloc으로 단계별 할당량과 최대 사용량을 기록하고
+    (실행이 느려짐), cprofile_path를 지정하면 블록이 끝날 때 cProfile 결과를 그 경로에 저장한다.
+    단계는 중첩될 수 있으며(예: slides 안의 create_birthday_slide) 이름별로 합산한다.
+    cProfile은 with 블록에 들어간 스레드만 측정한다.
+    """
+
+    def __init__(self, track_allocations: bool = False, cprofile_path: Optional[str] = None):
+        self.track_allocations = track_allocations
+        self.cprofile_path = cprofile_path
+        self._stages: Dict[str, _StageTotals] = {}
+        self._frames: List[_Frame] = []
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._started_tracemalloc = False
+        self._started_at: Optional[float] = None
+        self.elapsed = 0.0
+
+    def __enter__(self) -> 'Profiler':
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.cprofile_path:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.elapsed += time.perf_counter() - self._started_at
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.cprofile_path)
+            self._cprofile = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def stage(self, name: str):
+        """name 단계의 소요 시간을 누적 (메모리 추적 중이면 할당량과 최대 사용량도 기록)"""
+        tracing = self.track_allocations and tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            # 최대 사용량을 단계마다 다시 재므로, 지금까지의 최댓값은 바깥 단계에 넘겨 둠
+            if self._frames:
+                self._frames[-1].peak = max(self._frames[-1].peak, peak)
+            tracemalloc.reset_peak()
+            self._frames.append(_Frame(current))
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            totals = self._stages.get(name)
+            if totals is None:
+                totals = self._stages[name] = _StageTotals()
+            totals.count += 1
+            totals.total += elapsed
+            totals.max = max(totals.max, elapsed)
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                frame = self._frames.pop()
+                frame.peak = max(frame.peak, peak)
+                if self._frames:
+                    self._frames[-1].peak = max(self._frames[-1].peak, frame.peak)
+                totals.allocated += current - frame.start_memory
+                totals.peak = max(totals.peak, frame.peak - frame.start_memory)
+
+    def report(self) -> Dict:
+        """JSON으로 저장할 수 있는 단계별 보고서 (시간은 초, 메모리는 바이트)"""
+        stages = {}
+        for name, totals in self._stages.items():
+            entry = {
+                'count': totals.count,
+                'total_seconds': round(totals.total, 6),
+                'mean_seconds': round(totals.total / totals.count, 6),
+                'max_seconds': round(totals.max, 6),
+            }
+            if self.track_allocations:
+                # allocated_bytes: 단계가 끝난 뒤에도 남아 있는 할당량의 합
+                # peak_bytes: 단계 시작 시점 대비 최대 추가 사용량
+                entry['allocated_bytes'] = totals.allocated
+                entry['peak_bytes'] = totals.peak
+            stages[name] = entry
+        return {
+            'total_seconds': round(self.elapsed, 6),
+            'track_allocations': self.track_allocations,
+            'stages': stages,
+        }
+
+    def write_report(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
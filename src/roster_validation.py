@@ -0,0 +1,160 @@
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+ERROR = 'error'
+WARNING = 'warning'
+
+# 종류(오류/경고)별로 저장할 최대 항목 수 (개수는 모두 집계)
+DEFAULT_MAX_ISSUES = 100
+
+
+class ValidationIssue(NamedTuple):
+    """명단 검증에서 찾은 문제 하나"""
+    row: Optional[int]  # 엑셀 행 번호 (헤더가 1행, 컬럼 자체의 문제면 None)
+    column: str
+    value: str
+    reason: str
+    level: str = ERROR
+    source: str = ''  # 여러 명단을 병합할 때 파일/시트 이름
+
+    def describe(self) -> str:
+        source = f"[{self.source}] " if self.source else ''
+        row = f"{self.row}행 " if self.row is not None else ''
+        value = f" '{self.value}'" if self.value else ''
+        target = f"{row}{self.column}{value}".strip()
+        return f"{source}{target}: {self.reason}" if target else f"{source}{self.reason}"
+
+
+def _cell_text(value) -> str:
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ''
+    return str(value)
+
+
+class ValidationReport:
+    """명단 전체를 한 번에 검증한 결과 (오류는 생성을 막고 경고는 알리기만 함)"""
+
+    def __init__(self, max_issues: int = DEFAULT_MAX_ISSUES):
+        self.max_issues = max_issues
+        self.errors: List[ValidationIssue] = []
+        self.warnings: List[ValidationIssue] = []
+        self.counts: Dict[str, int] = {ERROR: 0, WARNING: 0}
+
+    @property
+    def issues(self) -> List[ValidationIssue]:
+        return self.errors + self.warnings
+
+    @property
+    def has_errors(self) -> bool:
+        return self.counts[ERROR] > 0
+
+    @property
+    def error_count(self) -> int:
+        return self.counts[ERROR]
+
+    @property
+    def warning_count(self) -> int:
+        return self.counts[WARNING]
+
+    def add(self, issue: ValidationIssue) -> None:
+        self.counts[issue.level] += 1
+        stored = self.errors if issue.level == ERROR else self.warnings
+        if len(stored) < self.max_issues:
+            stored.append(issue)
+
+    def add_rows(self, level: str, column: str, reason: Union[str, Sequence[str]], rows: Sequence[int],
+                 values: Sequence, sources: Optional[Sequence[str]] = None) -> None:
+        """같은 컬럼에서 걸린 여러 행을 추가 (reason은 공통 또는 행별, 저장할 수 있는 만큼만 항목을 만듦)"""
+        self.counts[level] += len(rows)
+        stored = self.errors if level == ERROR else self.warnings
+        room = max(self.max_issues - len(stored), 0)
+        for i in range(min(room, len(rows))):
+            stored.append(ValidationIssue(
+                int(rows[i]), column, _cell_text(values[i]),
+                reason if isinstance(reason, str) else reason[i], level,
+                sources[i] if sources is not None else ''
+            ))
+
+    def merge(self, other: 'ValidationReport', source: str) -> None:
+        """다른 명단의 검증 결과를 출처를 붙여 합침"""
+        for level, issues in ((ERROR, other.errors), (WARNING, other.warnings)):
+            stored = self.errors if level == ERROR else self.warnings
+            room = max(self.max_issues - len(stored), 0)
+            stored.extend(issue._replace(source=source) for issue in issues[:room])
+            self.counts[level] += other.counts[level]
+
+    def summary(self, limit: int = 20) -> str:
+        """사람이 읽을 요약 (오류를 먼저, 최대 limit개 항목)"""
+        lines = [f"검증 오류 {self.error_count}건, 경고 {self.warning_count}건"]
+        shown = self.issues[:limit]
+        lines.extend(f"- {issue.describe()}" for issue in shown)
+        hidden = self.error_count + self.warning_count - len(shown)
+        if hidden > 0:
+            lines.append(f"(외 {hidden}건)")
+        return '\n'.join(lines)
+
+    def to_dicts(self) -> List[Dict]:
+        """JSON 등으로 내보내기 위한 항목 목록"""
+        return [issue._asdict() for issue in self.issues]
+
+
+def validate_roster(df: pd.DataFrame, report: ValidationReport,
+                    required_columns: Sequence[str]) -> Optional[pd.Series]:
+    """명단 전체를 컬럼 단위 연산으로 한 번에 검증하고 파싱한 생년월일 반환
+
+    필수 컬럼 누락과 날짜 오류는 오류로, 중복 이름과 빈 성별은 경고로 기록한다.
+    한 가지 문제가 있어도 검사할 수 있는 나머지 항목은 모두 검사한다.
+    df의 인덱스는 엑셀 행 번호여야 한다. 생년월일 컬럼이 없으면 None을 반환한다.
+    """
+    for column in required_columns:
+        if column not in df.columns:
+            report.add(ValidationIssue(None, column, '', '필수 컬럼이 없습니다'))
+
+    rows = df.index.to_numpy()
+    birth_dates = None
+    if '생년월일' in df.columns:
+        raw = df['생년월일']
+        if pd.api.types.is_datetime64_any_dtype(raw):
+            # 이미 검증된 명단(캐시)은 다시 파싱하지 않음
+            birth_dates = raw
+        else:
+            birth_dates = pd.to_datetime(raw.astype(str), format='%Y-%m-%d', errors='coerce')
+        invalid = birth_dates.isna().to_numpy()
+        if invalid.any():
+            blank = raw.isna().to_numpy()[invalid]
+            reasons = np.where(blank, '생년월일이 비어 있습니다', '날짜 형식(YYYY-MM-DD)이 아닙니다')
+            report.add_rows(ERROR, '생년월일', reasons, rows[invalid], raw.to_numpy()[invalid])
+
+    if '이름' in df.columns:
+        names = df['이름']
+        duplicated = (names.notna() & names.duplicated(keep=False)).to_numpy()
+        if duplicated.any():
+            report.add_rows(WARNING, '이름', '이름이 중복됩니다', rows[duplicated], names.to_numpy()[duplicated])
+
+    if '성별' in df.columns:
+        genders = df['성별']
+        blank = (genders.isna() | genders.astype(str).str.strip().eq('')).to_numpy()
+        if blank.any():
+            report.add_rows(WARNING, '성별', '성별이 비어 있습니다', rows[blank], genders.to_numpy()[blank])
+
+    return birth_dates
+
+
+def check_months(birth_dates: pd.Series, report: ValidationReport, allow_multiple_months: bool,
+                 rows: Optional[np.ndarray] = None, sources: Optional[np.ndarray] = None) -> List[int]:
+    """감지된 월 목록 반환 (여러 월을 허용하지 않으면 가장 많은 월이 아닌 행을 오류로 기록)"""
+    months = birth_dates.dt.month
+    counts = months.value_counts()
+    detected = sorted(int(month) for month in counts.index)
+    if len(detected) > 1 and not allow_multiple_months:
+        main_month = min(detected, key=lambda month: (-counts[month], month))
+        mismatch = (months != main_month).to_numpy()
+        rows = birth_dates.index.to_numpy() if rows is None else rows
+        report.add_rows(
+            ERROR, '생년월일', f'{main_month}월 명단에 다른 월의 생일자가 있습니다',
+            rows[mismatch], birth_dates.dt.strftime('%Y-%m-%d').to_numpy()[mismatch],
+            sources[mismatch] if sources is not None else None
+        )
+    return detected
@@ -0,0 +1,374 @@
+"""생일 PPT 생성 HTTP 서비스 (표준 라이브러리만 사용)
+
+템플릿을 미리 로드해 둔 작업 프로세스 풀을 띄워 두고, 업로드된 명단으로 PPT를 만들어 돌려준다.
+
+    python src/server.py --port 8000 --workers 4
+
+    POST /render?month=3&compression=fast   본문: 엑셀(.xlsx) 바이트 → PPT 바이트
+                                             (per_slide=4: 슬라이드당 4명씩 격자 배치)
+    GET  /stats                              처리량/지연 시간 통계 (JSON)
+    GET  /health                             상태 확인
+"""
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, quote, urlparse
+
+from excel_processor import ExcelProcessor
+from ppt_generator import PPTGenerator, PPTGeneratorError, output_file_name
+from pptx_writer import Compression, resolve_compression
+
+logger = logging.getLogger(__name__)
+
+PPTX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+MAX_PEOPLE_PER_SLIDE = 100
+
+
+class RenderError(Exception):
+    """요청 내용 때문에 PPT를 만들 수 없는 경우 (HTTP 400)"""
+    pass
+
+
+# 작업 프로세스마다 한 번만 만드는 생성기 (템플릿을 미리 로드해 둠)
+_service_generator: Optional[PPTGenerator] = None
+
+
+def _init_service_worker(font_name: str, template_path: Optional[str]) -> None:
+    global _service_generator
+    # 풀을 다시 만들 때 fork된 작업 프로세스는 서비스의 SIGTERM 처리기를 물려받으므로 기본 동작으로 되돌림
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    _service_generator = PPTGenerator(font_name=font_name, template_path=template_path)
+
+
+def _warm_up() -> int:
+    return os.getpid()
+
+
+def _render_upload(roster_bytes: bytes, month: Optional[int], compression: Compression,
+                   people_per_slide: int = 1) -> Tuple[str, bytes]:
+    """업로드된 엑셀로 PPT 생성 (작업 프로세스에서 실행, (파일 이름, PPT 바이트) 반환)"""
+    fd, roster_path = tempfile.mkstemp(suffix='.xlsx')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(roster_bytes)
+        excel_processor = ExcelProcessor(use_cache=False, extra_columns=_service_generator.custom_fields)
+        success, message = excel_processor.read_excel(roster_path, allow_multiple_months=True)
+    finally:
+        os.remove(roster_path)
+    if not success:
+        raise RenderError(message)
+
+    months = excel_processor.detected_months
+    if not months:
+        raise RenderError("생일자 데이터가 없습니다.")
+    if month is None:
+        if len(months) > 1:
+            raise RenderError(f"여러 월의 생일자가 있습니다 ({', '.join(map(str, months))}월). month를 지정해주세요.")
+        month = months[0]
+    birthday_list = excel_processor.get_birthdays(month)
+    if not birthday_list:
+        raise RenderError(f"{month}월 생일자 데이터가 없습니다.")
+
+    _service_generator.set_people_per_slide(people_per_slide)
+    return output_file_name(month), _service_generator.render(month, birthday_list, compression=compression)
+
+
+class ServiceStats:
+    """요청 수와 최근 지연 시간 통계 (여러 요청 스레드에서 갱신)"""
+
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self.started_at = time.time()
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.pool_restarts = 0
+
+    def begin(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def end(self, success: bool, latency: float) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if success:
+                self.completed += 1
+                self._latencies.append(latency)
+            else:
+                self.failed += 1
+
+    def reject(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+    def pool_restarted(self) -> None:
+        with self._lock:
+            self.pool_restarts += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            uptime = time.time() - self.started_at
+            latencies = sorted(self._latencies)
+            completed, failed, rejected, in_flight = self.completed, self.failed, self.rejected, self.in_flight
+            pool_restarts = self.pool_restarts
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 1)
+
+        return {
+            'uptime_seconds': round(uptime, 1),
+            'completed': completed,
+            'failed': failed,
+            'rejected': rejected,
+            'in_flight': in_flight,
+            'pool_restarts': pool_restarts,
+            'throughput_per_minute': round(completed * 60 / uptime, 2) if uptime else 0.0,
+            'latency_ms': {
+                'samples': len(latencies),
+                'mean': round(sum(latencies) * 1000 / len(latencies), 1) if latencies else None,
+                'p50': percentile(0.50),
+                'p95': percentile(0.95),
+                'max': round(latencies[-1] * 1000, 1) if latencies else None,
+            },
+        }
+
+
+class RenderService:
+    """템플릿이 로드된 작업 프로세스 풀과 크기가 제한된 대기열"""
+
+    def __init__(self, font_name: str = "Pretendard", template_path: Optional[str] = None,
+                 max_workers: Optional[int] = None, queue_size: int = 16):
+        # 작업 프로세스에서 템플릿 로드가 실패하면 풀 전체가 깨지므로 먼저 확인 (실패하면 PPTGeneratorError)
+        PPTGenerator(font_name=font_name, template_path=template_path)
+        self.font_name = font_name
+        self.template_path = template_path
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = self._start_pool()
+        # 작업 프로세스가 비정상 종료되면 풀 전체가 깨지므로 표시해 두었다가 새 풀로 교체
+        self._pool_lock = threading.Lock()
+        self._pool_broken = False
+        # 실행 중 + 대기 중인 요청 수 제한 (가득 차면 바로 거절)
+        self._slots = threading.BoundedSemaphore(self.max_workers + queue_size)
+        self.stats = ServiceStats()
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_service_worker,
+                                   initargs=(self.font_name, self.template_path))
+
+    def _mark_broken(self, executor: ProcessPoolExecutor) -> None:
+        with self._pool_lock:
+            # 이미 교체된 풀에서 늦게 온 실패는 무시
+            if executor is self.executor:
+                self._pool_broken = True
+
+    def restore_pool(self) -> None:
+        """깨진 작업 프로세스 풀을 새 풀로 교체 (깨지지 않았으면 아무것도 하지 않음)"""
+        with self._pool_lock:
+            if not self._pool_broken:
+                return
+            broken = self.executor
+            self.executor = self._start_pool()
+            self._pool_broken = False
+        broken.shutdown(wait=False, cancel_futures=True)
+        self.stats.pool_restarted()
+        logger.warning("작업 프로세스가 비정상 종료되어 작업 프로세스 풀을 다시 만들었습니다")
+
+    def _on_done(self, executor: ProcessPoolExecutor, future: Future) -> None:
+        self._slots.release()
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            self._mark_broken(executor)
+
+    def warm_up(self) -> None:
+        """모든 작업 프로세스를 미리 띄워 템플릿을 로드해 둠"""
+        for future in [self.executor.submit(_warm_up) for _ in range(self.max_workers)]:
+            future.result()
+
+    def submit(self, roster_bytes: bytes, month: Optional[int], compression: Compression,
+               people_per_slide: int = 1) -> Optional[Future]:
+        """생성 요청을 대기열에 넣음 (대기열이 가득 찼으면 None)"""
+        if not self._slots.acquire(blocking=False):
+            self.stats.reject()
+            return None
+        try:
+            self.restore_pool()
+            executor = self.executor
+            try:
+                future = executor.submit(_render_upload, roster_bytes, month, compression, people_per_slide)
+            except BrokenProcessPool:
+                # 풀이 깨진 뒤 아직 실패한 요청이 없어 표시되지 않은 경우 한 번만 교체 후 다시 시도
+                self._mark_broken(executor)
+                self.restore_pool()
+                executor = self.executor
+                future = executor.submit(_render_upload, roster_bytes, month, compression, people_per_slide)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda done: self._on_done(executor, done))
+        return future
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    server_version = 'BirthdayPPT/1.0'
+
+    @property
+    def service(self) -> RenderService:
+        return self.server.service
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif path == '/stats':
+            self._send_json(200, self.service.stats.snapshot())
+        else:
+            self._send_json(404, {'error': '알 수 없는 경로입니다.'})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != '/render':
+            self._send_json(404, {'error': '알 수 없는 경로입니다.'})
+            return
+
+        try:
+            month, compression, people_per_slide = self._parse_query(url.query)
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        if length <= 0:
+            self._send_json(400, {'error': '엑셀 파일을 요청 본문으로 보내주세요.'})
+            return
+        if length > MAX_UPLOAD_BYTES:
+            self._send_json(413, {'error': f'파일이 너무 큽니다 (최대 {MAX_UPLOAD_BYTES // 1024 // 1024}MB).'})
+            return
+        roster_bytes = self.rfile.read(length)
+
+        start = time.perf_counter()
+        future = self.service.submit(roster_bytes, month, compression, people_per_slide)
+        if future is None:
+            self._send_json(503, {'error': '요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.'})
+            return
+
+        self.service.stats.begin()
+        success = False
+        try:
+            file_name, data = future.result()
+            success = True
+        except (RenderError, PPTGeneratorError) as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        except BrokenProcessPool:
+            logger.error("PPT 생성 중 작업 프로세스가 비정상 종료되었습니다")
+            self.service.restore_pool()
+            self._send_json(503, {'error': '작업 프로세스가 비정상 종료되었습니다. 잠시 후 다시 시도해주세요.'})
+            return
+        except Exception as e:
+            logger.exception("PPT 생성 중 오류")
+            self._send_json(500, {'error': f'PPT 생성 중 오류가 발생했습니다: {str(e)}'})
+            return
+        finally:
+            self.service.stats.end(success, time.perf_counter() - start)
+
+        self.send_response(200)
+        self.send_header('Content-Type', PPTX_CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('Content-Disposition', f"attachment; filename*=UTF-8''{quote(file_name)}")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _parse_query(self, query: str) -> Tuple[Optional[int], Compression, int]:
+        params = parse_qs(query)
+        month = None
+        if 'month' in params:
+            month = int(params['month'][0])
+            if not 1 <= month <= 12:
+                raise ValueError(f"month는 1~12 사이여야 합니다: {month}")
+        compression: Compression = params.get('compression', ['default'])[0]
+        if compression.isdigit():
+            compression = int(compression)
+        resolve_compression(compression)
+        people_per_slide = int(params.get('per_slide', ['1'])[0])
+        if not 1 <= people_per_slide <= MAX_PEOPLE_PER_SLIDE:
+            raise ValueError(f"per_slide는 1~{MAX_PEOPLE_PER_SLIDE} 사이여야 합니다: {people_per_slide}")
+        return month, compression, people_per_slide
+
+    def _send_json(self, status: int, body: Dict) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.info("%s - %s", self.address_string(), format % args)
+
+
+def _stop_on_sigterm(signum, frame) -> None:
+    raise KeyboardInterrupt
+
+
+def create_server(host: str, port: int, service: RenderService) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+    server.service = service
+    return server
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='생일 PPT 생성 HTTP 서비스')
+    parser.add_argument('--host', default='127.0.0.1', help='바인딩할 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000, help='포트 (기본값: 8000)')
+    parser.add_argument('--workers', type=int, default=None, help='작업 프로세스 수 (기본값: CPU 수)')
+    parser.add_argument('--queue-size', type=int, default=16, help='대기할 수 있는 최대 요청 수 (기본값: 16)')
+    parser.add_argument('--font', default='Pretendard', help='슬라이드에 적용할 폰트 (기본값: Pretendard)')
+    parser.add_argument('--template', help='템플릿 PPT 경로 (기본값: resources/templates/template.pptx)')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    try:
+        service = RenderService(args.font, args.template, args.workers, args.queue_size)
+    except PPTGeneratorError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    try:
+        service.warm_up()
+    except BrokenProcessPool as e:
+        print(f"작업 프로세스를 시작할 수 없습니다: {str(e)}", file=sys.stderr)
+        service.shutdown()
+        return 1
+
+    server = create_server(args.host, args.port, service)
+    # systemd/docker의 종료 요청(SIGTERM)도 Ctrl+C처럼 처리해 서버를 닫고 작업 프로세스를 정리
+    signal.signal(signal.SIGTERM, _stop_on_sigterm)
+    logger.info("서비스 시작: http://%s:%d (작업 프로세스 %d개)", args.host, args.port, service.max_workers)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
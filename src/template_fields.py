@@ -0,0 +1,146 @@
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from pptx.oxml.ns import qn
+
+from birthday_record import BirthdayRecord
+
+# 템플릿 자리표시자: {name}, {성별}, {부서} 등
+FIELD_PATTERN = re.compile(r'\{([^{}]+)\}')
+
+# 생일자 한 명에서 바로 얻을 수 있는 필드 (영문/한글 이름 모두 지원)
+_RECORD_FIELDS: Dict[str, Callable[[BirthdayRecord], str]] = {
+    'name': lambda person: person.name,
+    '이름': lambda person: person.name,
+    'gender': lambda person: person.gender,
+    '성별': lambda person: person.gender,
+    'age': lambda person: str(person.age),
+    '나이': lambda person: str(person.age),
+    'month': lambda person: str(person.month),
+    '월': lambda person: str(person.month),
+    'day': lambda person: str(person.day),
+    '일': lambda person: str(person.day),
+    'birth_date': lambda person: person.birth_date.isoformat(),
+    '생년월일': lambda person: person.birth_date.isoformat(),
+}
+
+# 타이틀 슬라이드에서 쓸 수 있는 PPT 단위 필드
+DECK_FIELDS = frozenset({'month', '월', 'count', '인원'})
+
+BUILTIN_FIELDS = frozenset(_RECORD_FIELDS) | DECK_FIELDS
+
+# 컴파일된 텍스트: ((앞 문자열, 필드 이름 또는 None), ...)
+CompiledText = Tuple[Tuple[str, Optional[str]], ...]
+# 요소 안의 a:t 순서 번호와 그 텍스트의 컴파일 결과
+CompiledElement = List[Tuple[int, CompiledText]]
+
+
+def compile_text(text: str) -> CompiledText:
+    """텍스트를 문자열 조각과 필드 이름의 나열로 분해"""
+    parts = []
+    position = 0
+    for match in FIELD_PATTERN.finditer(text):
+        parts.append((text[position:match.start()], match.group(1)))
+        position = match.end()
+    parts.append((text[position:], None))
+    return tuple(parts)
+
+
+def render_text(compiled: CompiledText, values: Dict[str, str]) -> str:
+    """컴파일된 텍스트에 값을 채움 (값이 없는 필드는 자리표시자 그대로 둠)"""
+    pieces = []
+    for literal, field in compiled:
+        pieces.append(literal)
+        if field is not None:
+            pieces.append(values.get(field, '{' + field + '}'))
+    return ''.join(pieces)
+
+
+def _line_runs(p) -> Iterable[List]:
+    """단락의 a:r을 줄바꿈(a:br) 단위로 묶어서 반환"""
+    group = []
+    for child in p.iterchildren():
+        if child.tag == qn('a:r'):
+            group.append(child)
+        elif child.tag == qn('a:br') and group:
+            yield group
+            group = []
+    if group:
+        yield group
+
+
+def join_split_fields(element) -> None:
+    """여러 런에 나뉜 자리표시자를 시작한 런으로 모음 (PowerPoint가 '{', 'name', '}'처럼 나누는 경우)
+
+    자리표시자는 시작한 런의 서식을 따르고, 나머지 텍스트는 원래 런에 남는다.
+    """
+    for p in element.iter(qn('a:p')):
+        for runs in _line_runs(p):
+            if len(runs) < 2:
+                continue
+            texts = [r.text for r in runs]
+            joined = ''.join(texts)
+            if '{' not in joined:
+                continue
+            # 글자마다 속한 런 번호를 매기고 자리표시자 글자는 모두 시작한 런으로 옮김
+            owners = [i for i, text in enumerate(texts) for _ in text]
+            for match in FIELD_PATTERN.finditer(joined):
+                first = owners[match.start()]
+                owners[match.start():match.end()] = [first] * (match.end() - match.start())
+            new_texts = [''] * len(runs)
+            for char, owner in zip(joined, owners):
+                new_texts[owner] += char
+            for r, text, new_text in zip(runs, texts, new_texts):
+                if text != new_text:
+                    r.text = new_text
+
+
+def compile_element(element) -> CompiledElement:
+    """도형 XML에서 자리표시자가 있는 a:t를 찾아 컴파일 (나뉜 자리표시자는 먼저 합침)"""
+    join_split_fields(element)
+    compiled = []
+    for index, t in enumerate(element.iter(qn('a:t'))):
+        text = t.text
+        if text and FIELD_PATTERN.search(text):
+            compiled.append((index, compile_text(text)))
+    return compiled
+
+
+def compiled_fields(compiled: CompiledElement) -> frozenset:
+    """컴파일 결과에 쓰인 필드 이름 집합"""
+    return frozenset(field for _, parts in compiled for _, field in parts if field is not None)
+
+
+def render_element(element, compiled: CompiledElement, values: Dict[str, str]) -> None:
+    """compile_element로 컴파일한 요소(또는 그 복제본)의 자리표시자를 한 번에 치환"""
+    if not compiled:
+        return
+    texts = list(element.iter(qn('a:t')))
+    for index, parts in compiled:
+        texts[index].text = render_text(parts, values)
+
+
+def scan_fields(element) -> frozenset:
+    """요소 안의 모든 자리표시자 이름 (런이 나뉘어 있어도 단락 텍스트 기준으로 찾음)"""
+    fields = set()
+    for p in element.iter(qn('a:p')):
+        text = ''.join(t.text or '' for t in p.iter(qn('a:t')))
+        fields.update(FIELD_PATTERN.findall(text))
+    return frozenset(fields)
+
+
+def record_values(person: BirthdayRecord, fields: Iterable[str]) -> Dict[str, str]:
+    """생일자 한 명의 필드 값 (템플릿에 쓰인 필드만 계산)"""
+    extra = dict(person.extra)
+    values = {}
+    for field in fields:
+        if field in _RECORD_FIELDS:
+            values[field] = _RECORD_FIELDS[field](person)
+        elif field in extra:
+            values[field] = extra[field]
+    return values
+
+
+def deck_values(month: int, count: int) -> Dict[str, str]:
+    """타이틀 슬라이드용 PPT 단위 필드 값"""
+    return {'month': str(month), '월': str(month), 'count': str(count), '인원': str(count)}
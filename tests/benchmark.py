@@ -0,0 +1,140 @@
+"""엑셀 → PPT 파이프라인 벤치마크
+
+가상 명단(1천/1만/10만 행, 단일 월/연간)과 최소 템플릿을 임시 폴더에 만든 뒤
+read_excel, get_birthdays, create_birthday_slide, prs.save 단계를 따로 측정한다.
+각 단계의 실행 시간과 최대 메모리(tracemalloc 기준, lxml 등 C 확장 할당은 제외)를 기록한다.
+
+    python tests/benchmark.py
+    python tests/benchmark.py --sizes 1000 10000 --json bench.json
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from io import BytesIO
+from typing import Callable, Dict, List
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, TESTS_DIR)
+sys.path.insert(0, os.path.join(TESTS_DIR, '..', 'src'))
+
+from pptx import Presentation
+from pptx.util import Inches, Pt
+from PIL import Image
+
+from create_sample_data import create_synthetic_roster
+from excel_processor import ExcelProcessor
+from ppt_generator import PPTGenerator
+
+
+def build_template(path: str) -> None:
+    """타이틀 슬라이드와 생일자 슬라이드(배경 이미지 + 자리표시자 텍스트)로 된 최소 템플릿 생성"""
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+
+    title_slide = prs.slides.add_slide(layout)
+    title_frame = title_slide.shapes.add_textbox(Inches(1), Inches(1), Inches(8), Inches(1.5)).text_frame
+    title_frame.text = "{month}월 생일자"
+    title_frame.paragraphs[0].runs[0].font.size = Pt(40)
+    title_frame.add_paragraph().text = "HAPPY BIRTHDAY"
+
+    birthday_slide = prs.slides.add_slide(layout)
+    image = BytesIO()
+    Image.new('RGB', (320, 240), (255, 230, 200)).save(image, 'PNG')
+    image.seek(0)
+    birthday_slide.shapes.add_picture(image, 0, 0, prs.slide_width, prs.slide_height)
+    text_frame = birthday_slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(2)).text_frame
+    text_frame.text = "{name}님"
+    text_frame.paragraphs[0].runs[0].font.size = Pt(36)
+    text_frame.add_paragraph().text = "{month}월 {day}일 생일을 축하합니다"
+
+    prs.save(path)
+
+
+def measure(stage: str, func: Callable, results: Dict[str, Dict[str, float]]):
+    """func 실행 시간(초)과 최대 메모리(MB)를 results[stage]에 기록하고 반환값을 돌려줌"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        return func()
+    finally:
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[stage] = {'seconds': round(elapsed, 4), 'peak_mb': round(peak / 1024 / 1024, 2)}
+
+
+def run_case(work_dir: str, template_path: str, n_rows: int, months: List[int],
+             max_slides: int) -> Dict[str, Dict[str, float]]:
+    roster_path = os.path.join(work_dir, f"roster_{n_rows}_{len(months)}.xlsx")
+    create_synthetic_roster(roster_path, n_rows, months)
+
+    results: Dict[str, Dict[str, float]] = {}
+    # 캐시 파일 저장 시간이 파싱 시간에 섞이지 않도록 캐시 없이 측정
+    excel_processor = ExcelProcessor(use_cache=False)
+    success, message = measure(
+        'read_excel',
+        lambda: excel_processor.read_excel(roster_path, allow_multiple_months=True),
+        results
+    )
+    if not success:
+        raise RuntimeError(message)
+
+    birthdays_by_month = measure('get_birthdays', excel_processor.get_birthdays_by_month, results)
+
+    # 슬라이드 생성은 첫 번째 월에서 최대 max_slides장까지만 측정
+    month = min(birthdays_by_month)
+    birthday_list = birthdays_by_month[month][:max_slides]
+    ppt_generator = PPTGenerator(font_name="Pretendard", template_path=template_path)
+    ppt_generator.create_title_slide(month)
+
+    def create_slides():
+        for person in birthday_list:
+            ppt_generator.create_birthday_slide(person)
+
+    measure('create_birthday_slide', create_slides, results)
+    results['create_birthday_slide']['slides'] = len(birthday_list)
+    results['create_birthday_slide']['ms_per_slide'] = round(
+        results['create_birthday_slide']['seconds'] * 1000 / max(len(birthday_list), 1), 3
+    )
+
+    output_path = os.path.join(work_dir, f"{month}월_생일자.pptx")
+    measure('save', lambda: ppt_generator.prs.save(output_path), results)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='엑셀 → PPT 파이프라인 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='명단 행 수 (기본값: 1000 10000 100000)')
+    parser.add_argument('--max-slides', type=int, default=1000,
+                        help='슬라이드 생성 단계에서 만들 최대 슬라이드 수 (기본값: 1000)')
+    parser.add_argument('--json', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args(argv)
+
+    cases = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        template_path = os.path.join(work_dir, 'template.pptx')
+        build_template(template_path)
+
+        for n_rows in args.sizes:
+            for label, months in (('single-month', [1]), ('full-year', list(range(1, 13)))):
+                stages = run_case(work_dir, template_path, n_rows, months, args.max_slides)
+                cases.append({'rows': n_rows, 'roster': label, 'stages': stages})
+                print(f"\n[{n_rows}행, {label}]")
+                for stage, result in stages.items():
+                    extra = f", {result['ms_per_slide']}ms/슬라이드" if 'ms_per_slide' in result else ''
+                    print(f"  {stage:<22} {result['seconds']:>9.3f}s  최대 {result['peak_mb']:>8.2f}MB{extra}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'python': sys.version.split()[0], 'cases': cases}, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,44 @@
+import random
+from datetime import date, timedelta
+from typing import Optional, Sequence
+
 import pandas as pd
 
-# 샘플 데이터 생성
-data = {
-    '이름': ['홍길동', '김영희', '이철수', '박미란', '정민수', '윤서연'],
-    '성별': ['남', '여', '남', '여', '남', '여'],
-    '생년월일': ['1990-01-15', '1992-01-22', '1988-01-30', 
-              '1995-01-18', '1993-01-05', '1991-01-10']
-}
 
-# DataFrame 생성
-df = pd.DataFrame(data)
+def create_synthetic_roster(path: str, n_rows: int, months: Optional[Sequence[int]] = None,
+                            seed: int = 0) -> pd.DataFrame:
+    """벤치마크용 가상 생일자 명단 생성 (months를 지정하지 않으면 1~12월 전체)"""
+    months = list(months or range(1, 13))
+    rng = random.Random(seed)
+    family_names = '김이박최정강조윤장임'
+    given_names = ['민수', '서연', '지훈', '하은', '도윤', '수아', '예준', '지민', '현우', '유진']
+
+    names, genders, birth_dates = [], [], []
+    for i in range(n_rows):
+        month = months[i % len(months)]
+        # 각 월의 1~28일 중 하나로 생일 지정 (모든 월에 존재하는 날짜)
+        birth_date = date(rng.randint(1960, 2004), month, 1) + timedelta(days=rng.randint(0, 27))
+        names.append(f"{rng.choice(family_names)}{rng.choice(given_names)}{i}")
+        genders.append(rng.choice('남여'))
+        birth_dates.append(birth_date.strftime('%Y-%m-%d'))
+
+    df = pd.DataFrame({'이름': names, '성별': genders, '생년월일': birth_dates})
+    df.to_excel(path, index=False)
+    return df
+
+
+if __name__ == '__main__':
+    # 샘플 데이터 생성
+    data = {
+        '이름': ['홍길동', '김영희', '이철수', '박미란', '정민수', '윤서연'],
+        '성별': ['남', '여', '남', '여', '남', '여'],
+        '생년월일': ['1990-01-15', '1992-01-22', '1988-01-30',
+                  '1995-01-18', '1993-01-05', '1991-01-10']
+    }
+
+    # DataFrame 생성
+    df = pd.DataFrame(data)
 
-# 엑셀 파일로 저장
-df.to_excel('tests/test_data/sample_birthday.xlsx', index=False)
-print("샘플 엑셀 파일이 생성되었습니다: tests/test_data/sample_birthday.xlsx")
\ No newline at end of file
+    # 엑셀 파일로 저장
+    df.to_excel('tests/test_data/sample_birthday.xlsx', index=False)
+    print("샘플 엑셀 파일이 생성되었습니다: tests/test_data/sample_birthday.xlsx")